@@ -1,12 +1,14 @@
 """Django AG-UI - Django integration for the AG-UI protocol."""
 
 from django_agui.decorators import agui_view
+from django_agui.runtime import setup_uvloop
 from django_agui.urls import AGUIRouter, get_agui_urlpatterns
 
 __all__ = [
     "AGUIRouter",
     "get_agui_urlpatterns",
     "agui_view",
+    "setup_uvloop",
     "VERSION",
 ]
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 import logging
 from typing import Any
 
@@ -16,11 +16,13 @@ from rest_framework.views import APIView
 from django_agui.runtime import (
     AGUIRequestError,
     AGUIRunner,
+    aenforce_origin_and_auth,
     enforce_max_content_length,
-    enforce_origin_and_auth,
     ensure_json_content_type,
+    freeze_allowed_origins,
     get_cors_headers,
     get_error_message,
+    get_preflight_cache_headers,
     get_request_origin,
     parse_run_input_json,
     resolve_allowed_origins,
@@ -37,11 +39,26 @@ class AGUIBaseView(APIView):
     translate_event: Callable[[Any], Any] | None = None
     get_system_message: Callable[[Any], str | None] | None = None
     auth_required: bool = False
-    allowed_origins: list[str] | None = None
+    allowed_origins: list[str] | tuple[str, ...] | None = None
     emit_run_lifecycle_events: bool | None = None
     error_detail_policy: str | None = None
     state_save_policy: str | None = None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Freeze a class-level ``allowed_origins`` list."""
+        super().__init_subclass__(**kwargs)
+        if "allowed_origins" in cls.__dict__:
+            cls.allowed_origins = freeze_allowed_origins(cls.allowed_origins)
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any):
+        """Build the view, freezing a per-route ``allowed_origins`` list."""
+        if "allowed_origins" in initkwargs:
+            initkwargs["allowed_origins"] = freeze_allowed_origins(
+                initkwargs["allowed_origins"]
+            )
+        return super().as_view(**initkwargs)
+
     def get_run_agent(self, request: Request) -> Callable[..., Any] | None:
         """Return the configured agent callable."""
         return self.run_agent
@@ -57,7 +74,7 @@ class AGUIBaseView(APIView):
         """Return whether auth is required for this request."""
         return self.auth_required
 
-    def get_allowed_origins(self, request: Request) -> list[str] | None:
+    def get_allowed_origins(self, request: Request) -> tuple[str, ...] | None:
         """Resolve allowed CORS origins for this request."""
         return resolve_allowed_origins(self.allowed_origins)
 
@@ -89,7 +106,7 @@ class AGUIBaseView(APIView):
         response: Any,
         *,
         origin: str | None,
-        allowed_origins: list[str] | None,
+        allowed_origins: Sequence[str] | None,
     ) -> None:
         """Apply CORS headers to a DRF/Django response."""
         for key, value in get_cors_headers(origin, allowed_origins).items():
@@ -101,7 +118,7 @@ class AGUIBaseView(APIView):
         *,
         status_code: int,
         origin: str | None,
-        allowed_origins: list[str] | None,
+        allowed_origins: Sequence[str] | None,
     ) -> Response:
         """Build an error response with CORS headers."""
         response = Response({"error": message}, status=status_code)
@@ -141,10 +158,11 @@ class AGUIBaseView(APIView):
             )
 
         try:
-            origin, allowed_origins = enforce_origin_and_auth(
+            origin, allowed_origins = await aenforce_origin_and_auth(
                 request,
                 auth_required=self.get_auth_required(request),
                 allowed_origins=allowed_origins,
+                origin=origin,
             )
             input_data = self.parse_input(request)
         except AGUIRequestError as exc:
@@ -220,6 +238,9 @@ class AGUIBaseView(APIView):
             origin=origin,
             allowed_origins=allowed_origins,
         )
+        if "Access-Control-Allow-Origin" in response:
+            for key, value in get_preflight_cache_headers().items():
+                response[key] = value
         return response
 
 
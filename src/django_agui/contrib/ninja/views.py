@@ -10,7 +10,7 @@ from django.http import StreamingHttpResponse
 from django_agui.runtime import (
     AGUIRequestError,
     AGUIRunner,
-    enforce_origin_and_auth,
+    aenforce_origin_and_auth,
     get_cors_headers,
     parse_run_input_payload,
 )
@@ -30,7 +30,7 @@ def create_ninja_endpoint(
 
     async def agent_endpoint(request, body: dict[str, Any]) -> Any:
         try:
-            origin, resolved_origins = enforce_origin_and_auth(
+            origin, resolved_origins = await aenforce_origin_and_auth(
                 request,
                 auth_required=auth_required,
                 allowed_origins=allowed_origins,
@@ -2,14 +2,23 @@
 
 from ag_ui.core import BaseEvent
 
+KEEPALIVE_PACKET = b": keepalive\n\n"
+
 
 class SSEEventEncoder:
-    """Encoder for Server-Sent Events format."""
+    """Encoder for Server-Sent Events format.
+
+    Packets are returned as UTF-8 bytes so the response layer can write
+    them without another encode step.
+    """
 
-    def encode(self, event: BaseEvent) -> str:
+    def encode(self, event: BaseEvent) -> bytes:
         """Encode an AG-UI event to SSE format."""
-        return f"data: {event.model_dump_json(by_alias=True, exclude_none=True)}\n\n"
+        payload = event.__pydantic_serializer__.to_json(
+            event, by_alias=True, exclude_none=True
+        )
+        return b"data: " + payload + b"\n\n"
 
-    def encode_keepalive(self) -> str:
+    def encode_keepalive(self) -> bytes:
         """Encode a keepalive message."""
-        return ": keepalive\n\n"
+        return KEEPALIVE_PACKET
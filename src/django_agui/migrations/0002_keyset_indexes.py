@@ -0,0 +1,53 @@
+# Generated by Django 5.2
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_agui", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="run",
+            name="agui_run_thread__f48d0e_idx",
+        ),
+        migrations.AddIndex(
+            model_name="run",
+            index=models.Index(
+                fields=["thread", "-started_at", "-id"], name="agui_run_thread_keyset"
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="message",
+            name="agui_messag_thread__4b62d1_idx",
+        ),
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["thread", "created_at", "id"],
+                name="agui_message_thread_keyset",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="toolcall",
+            name="agui_toolca_run_id_83e938_idx",
+        ),
+        migrations.AddIndex(
+            model_name="toolcall",
+            index=models.Index(
+                fields=["run", "started_at", "id"], name="agui_tool_call_run_keyset"
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="event",
+            name="agui_event_run_id_f852e8_idx",
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["run", "created_at", "id"], name="agui_event_run_keyset"
+            ),
+        ),
+    ]
@@ -113,7 +113,9 @@ class Run(models.Model):
         db_table = "agui_run"
         ordering = ["-started_at"]
         indexes = [
-            models.Index(fields=["thread", "-started_at"]),
+            models.Index(
+                fields=["thread", "-started_at", "-id"], name="agui_run_thread_keyset"
+            ),
             models.Index(fields=["status", "-started_at"]),
             models.Index(fields=["parent_run"]),
         ]
@@ -198,7 +200,10 @@ class Message(models.Model):
         db_table = "agui_message"
         ordering = ["created_at"]
         indexes = [
-            models.Index(fields=["thread", "created_at"]),
+            models.Index(
+                fields=["thread", "created_at", "id"],
+                name="agui_message_thread_keyset",
+            ),
             models.Index(fields=["run", "created_at"]),
             models.Index(fields=["role", "created_at"]),
         ]
@@ -263,7 +268,9 @@ class ToolCall(models.Model):
         db_table = "agui_tool_call"
         ordering = ["started_at"]
         indexes = [
-            models.Index(fields=["run", "started_at"]),
+            models.Index(
+                fields=["run", "started_at", "id"], name="agui_tool_call_run_keyset"
+            ),
             models.Index(fields=["status", "started_at"]),
         ]
 
@@ -303,7 +310,9 @@ class Event(models.Model):
         db_table = "agui_event"
         ordering = ["created_at"]
         indexes = [
-            models.Index(fields=["run", "created_at"]),
+            models.Index(
+                fields=["run", "created_at", "id"], name="agui_event_run_keyset"
+            ),
             models.Index(fields=["event_type", "created_at"]),
         ]
 
@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Iterable
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
 import inspect
-import json
 import logging
+import sys
+import threading
+import time
+from types import CoroutineType, MappingProxyType, MethodType
 from typing import Any, Protocol
+import warnings
 
 from ag_ui.core import (
     BaseEvent,
@@ -21,30 +28,41 @@ from ag_ui.core import (
     StateSnapshotEvent,
     SystemMessage,
 )
+from asgiref.sync import sync_to_async
 from django.conf import settings as django_settings
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http.request import HttpHeaders
+from pydantic import ValidationError
 
-from django_agui.encoders import SSEEventEncoder
-from django_agui.settings import get_backend_class, get_setting
+from django_agui.encoders import KEEPALIVE_PACKET, SSEEventEncoder
+from django_agui.settings import get_agui_settings, get_backend_class, get_setting
 
 logger = logging.getLogger(__name__)
 
+SAFE_ERROR_MESSAGE = "Agent execution failed"
+
 
 class StreamEncoder(Protocol):
     """Protocol for event encoder implementations."""
 
-    def encode(self, event: BaseEvent) -> str:
+    def encode(self, event: BaseEvent) -> str | bytes:
         """Encode an AG-UI event for transport."""
         ...
 
-    def encode_keepalive(self) -> str:
+    def encode_keepalive(self) -> str | bytes:
         """Encode a keepalive packet."""
         ...
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class AuthResult:
-    """Authentication/authorization result."""
+    """Authentication/authorization result.
+
+    Frozen because one instance is shared by every anonymous request and by
+    cached lookups.
+    """
 
     allowed: bool
     status_code: int | None = None
@@ -52,15 +70,25 @@ class AuthResult:
     user: Any = None
 
 
-@dataclass(slots=True)
 class AGUIRequestError(Exception):
     """Request validation/authorization error."""
 
-    status_code: int
-    message: str
+    __slots__ = ("status_code", "message")
 
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(status_code, message)
+        self.status_code = status_code
+        self.message = message
 
-@dataclass(slots=True)
+
+_ALLOWED_ANONYMOUS = AuthResult(allowed=True)
+
+# Validated events always carry ``EventType`` members, so snapshot detection
+# on the per-event path can be an identity check.
+_STATE_SNAPSHOT = EventType.STATE_SNAPSHOT
+
+
+@dataclass(frozen=True, slots=True)
 class AGUIExecutionConfig:
     """Execution options resolved from settings and per-view overrides."""
 
@@ -69,6 +97,7 @@ class AGUIExecutionConfig:
     emit_run_lifecycle_events: bool
     error_detail_policy: str
     state_save_policy: str
+    batch_bytes: int = 4096
 
     @classmethod
     def from_settings(
@@ -78,7 +107,31 @@ class AGUIExecutionConfig:
         error_detail_policy: str | None = None,
         state_save_policy: str | None = None,
     ) -> AGUIExecutionConfig:
-        """Build execution config from settings with optional overrides."""
+        """Build execution config from settings with optional overrides.
+
+        Without overrides the result is cached until the ``AGUI`` or
+        ``DEBUG`` settings change.
+        """
+        if (
+            emit_run_lifecycle_events is None
+            and error_detail_policy is None
+            and state_save_policy is None
+        ):
+            return _get_default_execution_config(cls)
+        return cls._resolve(
+            emit_run_lifecycle_events=emit_run_lifecycle_events,
+            error_detail_policy=error_detail_policy,
+            state_save_policy=state_save_policy,
+        )
+
+    @classmethod
+    def _resolve(
+        cls,
+        *,
+        emit_run_lifecycle_events: bool | None = None,
+        error_detail_policy: str | None = None,
+        state_save_policy: str | None = None,
+    ) -> AGUIExecutionConfig:
         resolved_emit = (
             bool(get_setting("EMIT_RUN_LIFECYCLE_EVENTS", True))
             if emit_run_lifecycle_events is None
@@ -93,9 +146,37 @@ class AGUIExecutionConfig:
             emit_run_lifecycle_events=resolved_emit,
             error_detail_policy=resolved_error_policy,
             state_save_policy=resolved_state_policy,
+            batch_bytes=int(get_setting("SSE_BATCH_BYTES", 4096) or 0),
         )
 
 
+# ``(AGUI settings dict, DEBUG, config class, config)`` for the last default
+# config. The dict is compared by identity so reassigning ``settings.AGUI``
+# (even without ``setting_changed``) invalidates it.
+_default_execution_config: tuple[Any, bool, type, AGUIExecutionConfig] | None = None
+
+
+def _get_default_execution_config(
+    config_cls: type[AGUIExecutionConfig],
+) -> AGUIExecutionConfig:
+    global _default_execution_config
+
+    agui_settings = get_agui_settings()
+    debug = bool(getattr(django_settings, "DEBUG", False))
+    cached = _default_execution_config
+    if (
+        cached is not None
+        and cached[0] is agui_settings
+        and cached[1] == debug
+        and cached[2] is config_cls
+    ):
+        return cached[3]
+
+    config = config_cls._resolve()
+    _default_execution_config = (agui_settings, debug, config_cls, config)
+    return config
+
+
 @dataclass(slots=True)
 class AGUICollectedRun:
     """Result of non-streaming execution."""
@@ -136,12 +217,27 @@ def resolve_state_save_policy(policy: str | None) -> str:
     return configured
 
 
+_JSON_CONTENT_TYPES = frozenset(
+    {
+        "application/json",
+        "application/json; charset=utf-8",
+        "application/json;charset=utf-8",
+    }
+)
+
+
+@lru_cache(maxsize=64)
+def _parse_is_json_media_type(content_type: str) -> bool:
+    return content_type.split(";", 1)[0].strip().lower() == "application/json"
+
+
 def is_json_content_type(content_type: str | None) -> bool:
     """Return True when request Content-Type is JSON (charset allowed)."""
     if not content_type:
         return False
-    media_type = content_type.split(";", 1)[0].strip().lower()
-    return media_type == "application/json"
+    if content_type in _JSON_CONTENT_TYPES:
+        return True
+    return _parse_is_json_media_type(content_type)
 
 
 def ensure_json_content_type(content_type: str | None) -> None:
@@ -150,25 +246,33 @@ def ensure_json_content_type(content_type: str | None) -> None:
         raise AGUIRequestError(400, "Content-Type must be application/json")
 
 
+@lru_cache(maxsize=64)
+def _header_key_variants(key: str) -> tuple[str, str, str, str]:
+    """Return ``(lowercase, HTTP_X, X, HTTP_HTTP_X)`` spellings of a header."""
+    normalized = key.upper().replace("-", "_")
+    return (
+        key.lower(),
+        f"HTTP_{normalized}",
+        normalized,
+        f"HTTP_HTTP_{normalized}",
+    )
+
+
 def get_request_header(request: Any, key: str) -> str | None:
     """Get a request header in a framework-agnostic way."""
-    wanted = key.lower()
-    if hasattr(request, "headers"):
-        direct = request.headers.get(key)
+    lower, http_key, meta_key, double_http_key = _header_key_variants(key)
+    headers = getattr(request, "headers", None)
+    if headers is not None:
+        # Django's ``HttpHeaders`` is case-insensitive; any other mapping may
+        # be keyed in lowercase (e.g. dicts built from ASGI scopes).
+        direct = headers.get(key)
+        if direct is None and not isinstance(headers, HttpHeaders):
+            direct = headers.get(lower)
         if direct is not None:
             return direct
-        for header_key, value in request.headers.items():
-            normalized = str(header_key).lower()
-            if normalized == wanted or normalized == f"http-{wanted}":
-                return str(value)
 
     meta = getattr(request, "META", {})
-    normalized = key.upper().replace("-", "_")
-    return (
-        meta.get(f"HTTP_{normalized}")
-        or meta.get(normalized)
-        or meta.get(f"HTTP_HTTP_{normalized}")
-    )
+    return meta.get(http_key) or meta.get(meta_key) or meta.get(double_http_key)
 
 
 def get_request_origin(request: Any) -> str | None:
@@ -176,7 +280,33 @@ def get_request_origin(request: Any) -> str | None:
     return get_request_header(request, "Origin")
 
 
-def resolve_allowed_origins(allowed_origins: list[str] | None) -> list[str] | None:
+@lru_cache(maxsize=32)
+def _normalize_origins(raw_origins: tuple[Any, ...]) -> tuple[str, ...]:
+    return tuple(str(origin) for origin in raw_origins)
+
+
+@lru_cache(maxsize=32)
+def _compile_origins(origins: tuple[str, ...]) -> tuple[bool, frozenset[str]]:
+    """Return ``(has_wildcard, origin_set)`` for an allow-list."""
+    return "*" in origins, frozenset(origins)
+
+
+def _get_compiled_origins(
+    allowed_origins: Sequence[str],
+) -> tuple[bool, frozenset[str]]:
+    if not isinstance(allowed_origins, tuple):
+        allowed_origins = tuple(allowed_origins)
+    return _compile_origins(allowed_origins)
+
+
+# Tuple allow-lists (settings, view overrides, or previously resolved values)
+# keyed by ``id``, holding a reference so the id cannot be reused while cached.
+_resolved_origins_by_id: dict[int, tuple[Any, tuple[str, ...]]] = {}
+
+
+def resolve_allowed_origins(
+    allowed_origins: Sequence[str] | None,
+) -> tuple[str, ...] | None:
     """Resolve allowed origins from view overrides or global settings."""
     raw_origins = allowed_origins
     if raw_origins is None:
@@ -185,31 +315,65 @@ def resolve_allowed_origins(allowed_origins: list[str] | None) -> list[str] | No
     if raw_origins is None:
         return None
 
+    cached = _resolved_origins_by_id.get(id(raw_origins))
+    if cached is not None and cached[0] is raw_origins:
+        return cached[1]
+
     if not isinstance(raw_origins, (list, tuple)):
         raise ImproperlyConfigured("AGUI.ALLOWED_ORIGINS must be a list or tuple")
 
-    return [str(origin) for origin in raw_origins]
+    if not isinstance(raw_origins, tuple):
+        # Lists may be mutated in place, so only tuples are cached by identity.
+        return _normalize_origins(tuple(raw_origins))
+
+    resolved = _normalize_origins(raw_origins)
+    if len(_resolved_origins_by_id) >= 32:
+        _resolved_origins_by_id.clear()
+    _resolved_origins_by_id[id(raw_origins)] = (raw_origins, resolved)
+    return resolved
+
+
+def freeze_allowed_origins(allowed_origins: Any) -> Any:
+    """Return list origin overrides as tuples so they resolve from cache.
+
+    ``resolve_allowed_origins`` only caches tuples, since lists can be
+    mutated in place; views freeze their per-route lists once at setup.
+    """
+    if isinstance(allowed_origins, list):
+        return tuple(allowed_origins)
+    return allowed_origins
 
 
-def is_origin_allowed(origin: str | None, allowed_origins: list[str] | None) -> bool:
+def is_origin_allowed(
+    origin: str | None,
+    allowed_origins: Sequence[str] | None,
+) -> bool:
     """Check whether request origin is allowed."""
     if allowed_origins is None:
         return True
     if origin is None:
         return True
-    if "*" in allowed_origins:
-        return True
-    return origin in allowed_origins
+    has_wildcard, origin_set = _get_compiled_origins(allowed_origins)
+    return has_wildcard or origin in origin_set
+
+
+_UNSET: Any = object()
 
 
 def enforce_origin_and_auth(
     request: Any,
     *,
     auth_required: bool = False,
-    allowed_origins: list[str] | None = None,
-) -> tuple[str | None, list[str] | None]:
-    """Validate CORS origin and authentication/authorization."""
-    origin = get_request_origin(request)
+    allowed_origins: Sequence[str] | None = None,
+    origin: str | None = _UNSET,
+) -> tuple[str | None, tuple[str, ...] | None]:
+    """Validate CORS origin and authentication/authorization.
+
+    Callers that already read the ``Origin`` header can pass it as
+    ``origin`` to skip a second header lookup.
+    """
+    if origin is _UNSET:
+        origin = get_request_origin(request)
     resolved_origins = resolve_allowed_origins(allowed_origins)
 
     if not is_origin_allowed(origin, resolved_origins):
@@ -222,28 +386,95 @@ def enforce_origin_and_auth(
     return origin, resolved_origins
 
 
+async def aenforce_origin_and_auth(
+    request: Any,
+    *,
+    auth_required: bool,
+    allowed_origins: Sequence[str] | None,
+    origin: Any = _UNSET,
+) -> tuple[str | None, tuple[str, ...] | None]:
+    """Async variant of ``enforce_origin_and_auth`` for async views.
+
+    The origin check stays on the event loop; authentication goes through
+    ``aauthenticate_request`` so backends never block it.
+    """
+    if origin is _UNSET:
+        origin = get_request_origin(request)
+    resolved_origins = resolve_allowed_origins(allowed_origins)
+
+    if not is_origin_allowed(origin, resolved_origins):
+        raise AGUIRequestError(403, "Origin not allowed")
+
+    auth = await aauthenticate_request(request, auth_required=auth_required)
+    if not auth.allowed:
+        raise AGUIRequestError(auth.status_code or 401, auth.message or "Unauthorized")
+
+    return origin, resolved_origins
+
+
+_CORS_STATIC_HEADERS: dict[str, str] = {
+    "Access-Control-Allow-Methods": "POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+}
+_NO_CORS_HEADERS: Mapping[str, str] = MappingProxyType({})
+_WILDCARD_CORS_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"Access-Control-Allow-Origin": "*", **_CORS_STATIC_HEADERS}
+)
+
+
 def get_cors_headers(
     origin: str | None,
-    allowed_origins: list[str] | None,
-) -> dict[str, str]:
-    """Build CORS headers for a response."""
-    if origin is None or allowed_origins is None:
-        return {}
-    if not is_origin_allowed(origin, allowed_origins):
-        return {}
+    allowed_origins: Sequence[str] | None,
+) -> Mapping[str, str]:
+    """Build CORS headers for a response.
 
-    headers: dict[str, str]
-    if "*" in allowed_origins:
-        headers = {"Access-Control-Allow-Origin": "*"}
-    else:
-        headers = {
+    The returned mapping may be shared between requests; treat it as
+    read-only.
+    """
+    if origin is None or allowed_origins is None:
+        return _NO_CORS_HEADERS
+
+    has_wildcard, origin_set = _get_compiled_origins(allowed_origins)
+    if has_wildcard:
+        return _WILDCARD_CORS_HEADERS
+    if origin not in origin_set:
+        return _NO_CORS_HEADERS
+    return _origin_cors_headers(origin)
+
+
+@lru_cache(maxsize=256)
+def _origin_cors_headers(origin: str) -> Mapping[str, str]:
+    # Only called for origins already matched against an allow-list, so
+    # the cache cannot be filled with arbitrary client-supplied values.
+    return MappingProxyType(
+        {
             "Access-Control-Allow-Origin": origin,
             "Vary": "Origin",
+            **_CORS_STATIC_HEADERS,
         }
+    )
 
-    headers["Access-Control-Allow-Methods"] = "POST, OPTIONS"
-    headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
-    return headers
+
+def get_preflight_cache_headers() -> Mapping[str, str]:
+    """Headers that let browsers and caches reuse an allowed preflight.
+
+    Only add these to preflight responses that were granted CORS headers;
+    the mapping is shared and read-only.
+    """
+    max_age = get_setting("CORS_PREFLIGHT_MAX_AGE")
+    if not max_age:
+        return _NO_CORS_HEADERS
+    return _preflight_cache_headers(int(max_age))
+
+
+@lru_cache(maxsize=8)
+def _preflight_cache_headers(max_age: int) -> Mapping[str, str]:
+    return MappingProxyType(
+        {
+            "Access-Control-Max-Age": str(max_age),
+            "Cache-Control": f"public, max-age={max_age}",
+        }
+    )
 
 
 def enforce_max_content_length(request: Any) -> None:
@@ -263,12 +494,21 @@ def enforce_max_content_length(request: Any) -> None:
         return
 
 
+_validate_run_input_json = RunAgentInput.__pydantic_validator__.validate_json
+
+
 def parse_run_input_json(body: Any) -> RunAgentInput:
-    """Parse and validate JSON AG-UI request body."""
+    """Parse and validate JSON AG-UI request body.
+
+    Parsing and validation happen in a single pass inside pydantic-core, so
+    there is no separate ``json.loads`` step to speed up.
+    """
     try:
-        return RunAgentInput.model_validate_json(body)
-    except json.JSONDecodeError as exc:
-        raise AGUIRequestError(400, f"Invalid JSON: {exc}") from exc
+        return _validate_run_input_json(body)
+    except ValidationError as exc:
+        if exc.errors(include_url=False)[0]["type"] == "json_invalid":
+            raise AGUIRequestError(400, f"Invalid JSON: {exc}") from exc
+        raise AGUIRequestError(400, f"Invalid request: {exc}") from exc
     except Exception as exc:
         raise AGUIRequestError(400, f"Invalid request: {exc}") from exc
 
@@ -281,31 +521,105 @@ def parse_run_input_payload(payload: Any) -> RunAgentInput:
         raise AGUIRequestError(400, f"Invalid request: {exc}") from exc
 
 
+_DEFAULT_ENCODER = SSEEventEncoder()
+
+
 def build_event_encoder() -> StreamEncoder:
-    """Build event encoder from settings."""
+    """Build event encoder from settings.
+
+    Encoders are shared across requests like the other configured backends.
+    """
     encoder_cls = get_backend_class("EVENT_ENCODER")
     if encoder_cls is None:
-        return SSEEventEncoder()
+        return _DEFAULT_ENCODER
 
-    encoder = encoder_cls()
+    encoder = _instantiate_backend(encoder_cls)
     if not hasattr(encoder, "encode"):
         raise ImproperlyConfigured(
             "EVENT_ENCODER must implement an encode(event) method"
         )
     if not hasattr(encoder, "encode_keepalive"):
-        encoder.encode_keepalive = lambda: ": keepalive\n\n"  # type: ignore[attr-defined]
+        encoder.encode_keepalive = lambda: KEEPALIVE_PACKET  # type: ignore[attr-defined]
     return encoder
 
 
+@lru_cache(maxsize=8)
+def _get_shared_backend(backend_cls: type) -> Any:
+    return backend_cls()
+
+
+def _instantiate_backend(backend_cls: type) -> Any:
+    """Return a backend instance, shared unless the class opts out.
+
+    Backends are assumed stateless and reused across requests. Set
+    ``per_request = True`` on a backend class to get a fresh instance per call.
+    """
+    if getattr(backend_cls, "per_request", False):
+        return backend_cls()
+    return _get_shared_backend(backend_cls)
+
+
+def _reset_backends_cache() -> None:
+    """Drop shared backend instances (e.g. after settings change in tests)."""
+    _get_shared_backend.cache_clear()
+
+
+@receiver(setting_changed)
+def _reset_caches_on_setting_changed(*, setting: str, **kwargs: Any) -> None:
+    global _default_execution_config
+
+    if setting == "AGUI":
+        _reset_backends_cache()
+        _default_execution_config = None
+        _resolved_origins_by_id.clear()
+        invalidate_auth_cache()
+
+
 def _get_auth_backend() -> Any:
     auth_backend_cls = get_backend_class("AUTH_BACKEND")
     if auth_backend_cls is None:
         return None
-    return auth_backend_cls()
+    return _instantiate_backend(auth_backend_cls)
+
+
+_AUTH_CACHE_MAXSIZE = 1024
+_auth_cache: OrderedDict[tuple[Any, ...], tuple[float, AuthResult]] = OrderedDict()
+_auth_cache_lock = threading.Lock()
+
+
+def _auth_cache_key(request: Any, backend: Any) -> tuple[Any, ...] | None:
+    # Both credentials go into the key: a backend may authenticate from the
+    # session even when an unrelated ``Authorization`` header is present.
+    authorization = get_request_header(request, "Authorization") or ""
+    cookies = getattr(request, "COOKIES", None) or {}
+    session = (
+        cookies.get(getattr(django_settings, "SESSION_COOKIE_NAME", "sessionid")) or ""
+    )
+    if not authorization and not session:
+        return None
+    digest = hashlib.blake2b(
+        f"{authorization}\0{session}".encode(), digest_size=16
+    ).digest()
+    return type(backend), digest, getattr(request, "path", "")
+
+
+def invalidate_auth_cache(user_id: Any = None) -> None:
+    """Drop cached auth results, optionally only those for one user id."""
+    with _auth_cache_lock:
+        if user_id is None:
+            _auth_cache.clear()
+            return
+        for key, (_, result) in list(_auth_cache.items()):
+            if getattr(result.user, "pk", getattr(result.user, "id", None)) == user_id:
+                del _auth_cache[key]
 
 
 def authenticate_request(request: Any, *, auth_required: bool = False) -> AuthResult:
-    """Authenticate and authorize request using configured backend."""
+    """Authenticate and authorize request using configured backend.
+
+    With ``AUTH_CACHE_TTL`` set, results for authenticated users are cached
+    per credential and path for that many seconds.
+    """
     require_auth = auth_required or bool(get_setting("REQUIRE_AUTHENTICATION", False))
     backend = _get_auth_backend()
 
@@ -317,50 +631,171 @@ def authenticate_request(request: Any, *, auth_required: bool = False) -> AuthRe
                 status_code=500,
                 message="Authentication backend is not configured",
             )
-        return AuthResult(allowed=True)
+        return _ALLOWED_ANONYMOUS
+
+    cache_ttl = float(get_setting("AUTH_CACHE_TTL", 0) or 0)
+    cache_key = _auth_cache_key(request, backend) if cache_ttl > 0 else None
+    if cache_key is not None:
+        with _auth_cache_lock:
+            cached = _auth_cache.get(cache_key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    _auth_cache.move_to_end(cache_key)
+                    request.agui_user = cached[1].user
+                    return cached[1]
+                del _auth_cache[cache_key]
 
     user = backend.authenticate(request)
     request.agui_user = user
 
-    if require_auth and user is None:
-        return AuthResult(
-            allowed=False,
-            status_code=401,
-            message="Authentication required",
-        )
+    if user is None:
+        if require_auth:
+            return AuthResult(
+                allowed=False,
+                status_code=401,
+                message="Authentication required",
+            )
+        return _ALLOWED_ANONYMOUS
 
     request_path = getattr(request, "path", "")
-    if user is not None and not backend.check_permission(user, request_path):
-        return AuthResult(
+    if backend.check_permission(user, request_path):
+        result = AuthResult(allowed=True, user=user)
+    else:
+        result = AuthResult(
             allowed=False,
             status_code=403,
             message="Permission denied",
             user=user,
         )
 
-    return AuthResult(allowed=True, user=user)
+    # Anonymous outcomes depend on ``auth_required`` and are never cached.
+    if cache_key is not None:
+        with _auth_cache_lock:
+            _auth_cache[cache_key] = (time.monotonic() + cache_ttl, result)
+            if len(_auth_cache) > _AUTH_CACHE_MAXSIZE:
+                _auth_cache.popitem(last=False)
+    return result
+
+
+async def aauthenticate_request(
+    request: Any, *, auth_required: bool = False
+) -> AuthResult:
+    """Authenticate from async code without blocking the event loop.
+
+    Auth backends may touch the database (``request.user`` is a lazy session
+    lookup), so they run through ``sync_to_async``. Without a configured
+    backend there is nothing to offload and the check runs inline.
+    """
+    if _get_auth_backend() is None:
+        return authenticate_request(request, auth_required=auth_required)
+    return await sync_to_async(authenticate_request)(
+        request, auth_required=auth_required
+    )
 
 
 def _get_state_backend() -> Any | None:
     state_backend_cls = get_backend_class("STATE_BACKEND")
     if state_backend_cls is None:
         return None
-    return state_backend_cls()
+    return _instantiate_backend(state_backend_cls)
 
 
 def get_error_message(exc: Exception, *, policy: str) -> str:
     """Build client-facing error message based on resolved policy."""
     if policy == "full":
         return str(exc)
-    return "Agent execution failed"
+    return SAFE_ERROR_MESSAGE
+
+
+# Eager tasks (3.12+) run a coroutine up to its first suspension inside the
+# constructor, so results that need no waiting are available immediately.
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+if _EAGER_TASKS:
+
+    def _start_task(coro: Any) -> asyncio.Task[Any]:
+        """Start ``coro`` eagerly so already-ready results skip a loop cycle."""
+        # ``eager_start`` needs an explicit loop; without one the Task
+        # constructor fails before the coroutine runs.
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+
+else:
+    _start_task = asyncio.create_task
+
+
+def _bytes_packets(encode: Any) -> Any:
+    """Wrap an encoder method so ``str`` packets come back as UTF-8 bytes."""
+
+    def encode_bytes(*args: Any) -> bytes:
+        packet = encode(*args)
+        return packet.encode("utf-8") if isinstance(packet, str) else packet
+
+    return encode_bytes
+
+
+async def _discard_task(task: asyncio.Task[Any]) -> None:
+    """Cancel ``task`` and wait for it, retrieving any exception it raised."""
+    task.cancel()
+    with suppress(Exception, asyncio.CancelledError):
+        await task
+
+
+async def _prepend_task_result(
+    first: asyncio.Task[BaseEvent],
+    events: AsyncIterator[BaseEvent],
+) -> AsyncIterator[BaseEvent]:
+    """Yield the result of an already-started ``anext`` task, then ``events``."""
+    try:
+        event = await first
+    except StopAsyncIteration:
+        return
+    yield event
+    async for event in events:
+        yield event
+
+
+def _build_full_error_event(exc: Exception) -> RunErrorEvent:
+    return RunErrorEvent(
+        type=EventType.RUN_ERROR,
+        message=str(exc),
+        code="timeout" if isinstance(exc, TimeoutError) else None,
+    )
+
+
+def _build_safe_error_event(exc: Exception) -> RunErrorEvent:
+    return RunErrorEvent(
+        type=EventType.RUN_ERROR,
+        message=SAFE_ERROR_MESSAGE,
+        code="timeout" if isinstance(exc, TimeoutError) else None,
+    )
 
 
 async def _maybe_await(value: Any) -> Any:
-    if inspect.isawaitable(value):
+    # Plain attribute probes instead of ``inspect.isawaitable``, which falls
+    # back to an ABC ``isinstance`` check for every non-awaitable value.
+    if type(value) is CoroutineType or hasattr(value, "__await__"):
         return await value
     return value
 
 
+class _SyncToAsyncIterator:
+    """Expose a sync iterator as an async one without a generator frame."""
+
+    __slots__ = ("_iterator",)
+
+    def __init__(self, iterator: Any) -> None:
+        self._iterator = iterator
+
+    def __aiter__(self) -> _SyncToAsyncIterator:
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
 async def _to_async_iterator(value: Any) -> AsyncIterator[Any]:
     if hasattr(value, "__aiter__"):
         return value
@@ -370,44 +805,25 @@ async def _to_async_iterator(value: Any) -> AsyncIterator[Any]:
         return resolved
 
     if isinstance(resolved, Iterable):
-
-        async def _iter_sync() -> AsyncIterator[Any]:
-            for item in resolved:
-                yield item
-
-        return _iter_sync()
+        return _SyncToAsyncIterator(iter(resolved))
 
     raise TypeError("Expected async iterator, awaitable async iterator, or iterable")
 
 
 def _unwrap_bound_callable(func: Any) -> Any:
     """Return plain callable if class-level function is accessed as bound method."""
-    if inspect.ismethod(func):
+    if type(func) is MethodType:
         return func.__func__
     return func
 
 
-async def _translate_events(
-    event: BaseEvent,
-    translate_event: Any,
-) -> AsyncIterator[BaseEvent]:
-    if translate_event is None:
-        yield event
-        return
-
-    translated = _unwrap_bound_callable(translate_event)(event)
-    translated_iter = await _to_async_iterator(translated)
-    async for item in translated_iter:
-        yield item
-
-
 async def prepare_input(
     input_data: RunAgentInput,
     request: Any,
     get_system_message: Any = None,
 ) -> tuple[RunAgentInput, Any]:
     """Prepare RunAgentInput with optional system message and persisted state."""
-    prepared = input_data
+    updates: dict[str, Any] = {}
 
     if get_system_message is not None:
         system_message = await _maybe_await(
@@ -415,24 +831,72 @@ async def prepare_input(
         )
         if system_message:
             system = SystemMessage(
-                id=f"system-{prepared.run_id}",
+                id=f"system-{input_data.run_id}",
                 content=str(system_message),
             )
-            prepared = prepared.model_copy(
-                update={"messages": [system, *prepared.messages]}
-            )
+            updates["messages"] = [system, *input_data.messages]
 
     state_backend = _get_state_backend()
-    if state_backend is not None and prepared.state is None:
-        loaded_state = await _maybe_await(state_backend.load_state(prepared.thread_id))
+    if state_backend is not None and input_data.state is None:
+        loaded_state = await _maybe_await(
+            state_backend.load_state(input_data.thread_id)
+        )
         if loaded_state is not None:
-            prepared = prepared.model_copy(update={"state": loaded_state})
+            updates["state"] = loaded_state
+
+    if not updates:
+        return input_data, state_backend
+    # model_copy does not re-validate, so this is one shallow copy at most.
+    return input_data.model_copy(update=updates), state_backend
+
+
+def setup_uvloop() -> None:
+    """Install uvloop (winloop on Windows) as the asyncio event loop policy.
+
+    Only for entry points that create their own event loop (scripts or
+    management commands calling ``asyncio.run``). ASGI servers create the
+    loop before importing the application, so configure uvloop on the server
+    instead, e.g. ``uvicorn --loop uvloop``; calling this from ``asgi.py``
+    has no effect and only warns. Event loop policies are deprecated from
+    Python 3.14.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        warnings.warn(
+            "setup_uvloop() has no effect once an event loop is running; "
+            "select uvloop in the server instead (e.g. uvicorn --loop uvloop).",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return
+
+    if sys.platform == "win32":
+        try:
+            import winloop as loop_impl
+        except ImportError as exc:
+            raise ImportError(
+                "winloop is not installed. Install it with: pip install winloop"
+            ) from exc
+    else:
+        try:
+            import uvloop as loop_impl
+        except ImportError as exc:
+            raise ImportError(
+                "uvloop is not installed. Install it with: pip install uvloop"
+            ) from exc
 
-    return prepared, state_backend
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
 
 
 class AGUIRunner:
-    """Shared AG-UI runner for framework adapters."""
+    """Shared AG-UI runner for framework adapters.
+
+    The runner is asyncio-bound; for high event rates run the server on
+    uvloop (e.g. ``uvicorn --loop uvloop``).
+    """
 
     def __init__(
         self,
@@ -458,81 +922,143 @@ class AGUIRunner:
         )
         self._last_state: Any = None
         self._saw_state_snapshot = False
+        # Items of the current translator list still to be yielded; while
+        # non-zero, ``stream`` holds packets back to send them as one chunk.
+        self._ready_backlog = 0
+        self._build_error_event = (
+            _build_full_error_event
+            if self.config.error_detail_policy == "full"
+            else _build_safe_error_event
+        )
+
+        # The callables are fixed for the runner's lifetime, so resolve them
+        # (and the translator's shape) once instead of per run or per event.
+        self._run_agent_fn = _unwrap_bound_callable(run_agent)
+        self._get_system_message_fn = (
+            _unwrap_bound_callable(get_system_message)
+            if get_system_message is not None
+            else None
+        )
+        self._translate_fn = (
+            _unwrap_bound_callable(translate_event)
+            if translate_event is not None
+            else None
+        )
+        self._translate_is_async_gen = inspect.isasyncgenfunction(self._translate_fn)
+        self._iter_events = (
+            self._iter_events_raw
+            if self._translate_fn is None
+            else self._iter_events_translated
+        )
 
-    async def _iter_events(self, input_data: RunAgentInput) -> AsyncIterator[BaseEvent]:
-        run_agent = _unwrap_bound_callable(self.run_agent)
-        agent_result = run_agent(input_data, self.request)
-        agent_iter = await _to_async_iterator(agent_result)
-        async for event in agent_iter:
-            async for translated in _translate_events(event, self.translate_event):
-                if translated.type == EventType.STATE_SNAPSHOT and isinstance(
-                    translated, StateSnapshotEvent
+    async def _open_agent_iter(self, input_data: RunAgentInput) -> AsyncIterator[Any]:
+        return await _to_async_iterator(self._run_agent_fn(input_data, self.request))
+
+    async def _iter_events_raw(
+        self,
+        input_data: RunAgentInput,
+    ) -> AsyncIterator[BaseEvent]:
+        async for event in await self._open_agent_iter(input_data):
+            if event.type is _STATE_SNAPSHOT and isinstance(event, StateSnapshotEvent):
+                self._last_state = event.snapshot
+                self._saw_state_snapshot = True
+            yield event
+
+    async def _iter_events_translated(
+        self,
+        input_data: RunAgentInput,
+    ) -> AsyncIterator[BaseEvent]:
+        translate_fn = self._translate_fn
+        is_async_gen = self._translate_is_async_gen
+        async for event in await self._open_agent_iter(input_data):
+            translated = translate_fn(event)
+            # Plain lists/tuples are the common non-generator return; walk them
+            # directly instead of probing and wrapping them in an async iterator.
+            if not is_async_gen and type(translated) not in (list, tuple):
+                translated = await _to_async_iterator(translated)
+            if type(translated) in (list, tuple):
+                backlog = len(translated)
+                for item in translated:
+                    backlog -= 1
+                    self._ready_backlog = backlog
+                    if item.type is _STATE_SNAPSHOT and isinstance(
+                        item, StateSnapshotEvent
+                    ):
+                        self._last_state = item.snapshot
+                        self._saw_state_snapshot = True
+                    yield item
+                continue
+            async for item in translated:
+                if item.type is _STATE_SNAPSHOT and isinstance(
+                    item, StateSnapshotEvent
                 ):
-                    self._last_state = translated.snapshot
+                    self._last_state = item.snapshot
                     self._saw_state_snapshot = True
-                yield translated
+                yield item
+
+    async def _iter_events_with_timeout(
+        self,
+        events: AsyncIterator[BaseEvent],
+    ) -> AsyncIterator[BaseEvent]:
+        """Apply the run timeout when keepalive ticks are disabled."""
+        deadline = asyncio.get_running_loop().time() + self.config.timeout
+        # No keepalive ticks to interleave, so each ``anext`` is awaited in
+        # place under the run deadline without a task.
+        while True:
+            try:
+                async with asyncio.timeout_at(deadline) as scope:
+                    event = await anext(events)
+            except StopAsyncIteration:
+                return
+            except TimeoutError:
+                if scope.expired():
+                    raise TimeoutError("AG-UI stream timed out") from None
+                raise
+            yield event
 
     async def _iter_events_with_keepalive(
         self,
         events: AsyncIterator[BaseEvent],
     ) -> AsyncIterator[BaseEvent | None]:
-        keepalive = self.config.keepalive_interval
+        """Yield ``None`` whenever the agent is idle for a keepalive interval."""
         timeout = self.config.timeout
-
-        if keepalive <= 0 and timeout <= 0:
-            async for event in events:
-                yield event
-            return
-
         loop = asyncio.get_running_loop()
-        started = loop.time()
+        deadline = loop.time() + timeout if timeout > 0 else None
+        keepalive_interval = float(self.config.keepalive_interval)
         next_event_task: asyncio.Task[BaseEvent] | None = None
 
         try:
             while True:
-                if timeout > 0:
-                    elapsed = loop.time() - started
-                    if elapsed >= timeout:
+                wait_time = keepalive_interval
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
                         raise TimeoutError("AG-UI stream timed out")
-
-                wait_time: float | None = None
-                if keepalive > 0:
-                    wait_time = float(keepalive)
-                if timeout > 0:
-                    elapsed = loop.time() - started
-                    remaining = max(timeout - elapsed, 0.0)
-                    wait_time = (
-                        remaining if wait_time is None else min(wait_time, remaining)
-                    )
+                    if remaining < wait_time:
+                        wait_time = remaining
 
                 if next_event_task is None:
-                    next_event_task = asyncio.create_task(anext(events))
-
-                if wait_time is None:
-                    try:
-                        yield await next_event_task
-                    except StopAsyncIteration:
-                        return
-                    finally:
-                        next_event_task = None
-                    continue
-
-                done, _ = await asyncio.wait({next_event_task}, timeout=wait_time)
-                if not done:
-                    elapsed = loop.time() - started
-                    if timeout > 0 and elapsed >= timeout:
-                        raise TimeoutError("AG-UI stream timed out")
-                    yield None
-                    continue
+                    next_event_task = _start_task(anext(events))
+
+                # ``asyncio.wait`` leaves the pending ``anext`` task running on
+                # timeout, so it is reused until the agent produces.
+                if not next_event_task.done():
+                    await asyncio.wait((next_event_task,), timeout=wait_time)
+                    if not next_event_task.done():
+                        if deadline is not None and loop.time() >= deadline:
+                            raise TimeoutError("AG-UI stream timed out")
+                        yield None
+                        continue
 
                 try:
-                    yield next_event_task.result()
+                    event = next_event_task.result()
                 except StopAsyncIteration:
                     return
                 finally:
                     next_event_task = None
+                yield event
         finally:
-            if next_event_task is not None:
+            if next_event_task is not None and not next_event_task.done():
                 next_event_task.cancel()
                 with suppress(asyncio.CancelledError, StopAsyncIteration):
                     await next_event_task
@@ -566,25 +1092,36 @@ class AGUIRunner:
             )
         )
 
-    def _build_error_event(self, exc: Exception) -> RunErrorEvent:
-        return RunErrorEvent(
-            type=EventType.RUN_ERROR,
-            message=get_error_message(exc, policy=self.config.error_detail_policy),
-            code="timeout" if isinstance(exc, TimeoutError) else None,
-        )
-
-    async def stream(self, input_data: RunAgentInput) -> AsyncIterator[str]:
+    async def stream(self, input_data: RunAgentInput) -> AsyncIterator[str | bytes]:
         """Yield encoded AG-UI packets."""
         prepared_input, state_backend = await prepare_input(
             input_data,
             self.request,
-            self.get_system_message,
+            self._get_system_message_fn,
         )
         self._last_state = prepared_input.state
 
+        # RUN_STARTED shares a chunk with the first agent event only when
+        # that event is ready without waiting; otherwise it is sent alone
+        # straight away. Events a translator returned together are coalesced
+        # into one chunk, up to ``SSE_BATCH_BYTES``.
+        pending: Any = None
+        # Run-constant lookups are bound once instead of per event.
+        config = self.config
+        encoder = self.encoder
+        encode = encoder.encode
+        encode_keepalive = encoder.encode_keepalive
+        if type(encoder) is not SSEEventEncoder:
+            # Custom encoders may return ``str``; packets are concatenated
+            # when coalesced, so everything is normalized to bytes.
+            encode = _bytes_packets(encode)
+            encode_keepalive = _bytes_packets(encode_keepalive)
+        emit_lifecycle = config.emit_run_lifecycle_events
+        batch_bytes = config.batch_bytes
+
         try:
-            if self.config.emit_run_lifecycle_events:
-                yield self.encoder.encode(
+            if emit_lifecycle:
+                pending = encode(
                     RunStartedEvent(
                         type=EventType.RUN_STARTED,
                         thread_id=prepared_input.thread_id,
@@ -593,16 +1130,48 @@ class AGUIRunner:
                     )
                 )
 
-            async for event in self._iter_events_with_keepalive(
-                self._iter_events(prepared_input)
-            ):
-                if event is None:
-                    yield self.encoder.encode_keepalive()
-                    continue
-                yield self.encoder.encode(event)
-
-            if self.config.emit_run_lifecycle_events:
-                yield self.encoder.encode(
+            events = self._iter_events(prepared_input)
+            if pending is not None:
+                first = _start_task(anext(events)) if _EAGER_TASKS else None
+                if first is None or not first.done():
+                    packet, pending = pending, None
+                    try:
+                        yield packet
+                    except BaseException:
+                        # The consumer went away before the first event was
+                        # taken; don't leave the agent running on its own.
+                        if first is not None:
+                            await _discard_task(first)
+                        raise
+                if first is not None:
+                    events = _prepend_task_result(first, events)
+            keepalive = config.keepalive_interval
+            if keepalive <= 0 and config.timeout <= 0:
+                async for event in events:
+                    packet = encode(event)
+                    if pending is not None:
+                        packet, pending = pending + packet, None
+                    if self._ready_backlog and len(packet) < batch_bytes:
+                        pending = packet
+                        continue
+                    yield packet
+            else:
+                limited = (
+                    self._iter_events_with_keepalive(events)
+                    if keepalive > 0
+                    else self._iter_events_with_timeout(events)
+                )
+                async for event in limited:
+                    packet = encode_keepalive() if event is None else encode(event)
+                    if pending is not None:
+                        packet, pending = pending + packet, None
+                    if self._ready_backlog and len(packet) < batch_bytes:
+                        pending = packet
+                        continue
+                    yield packet
+
+            if emit_lifecycle:
+                packet = encode(
                     RunFinishedEvent(
                         type=EventType.RUN_FINISHED,
                         thread_id=prepared_input.thread_id,
@@ -610,7 +1179,14 @@ class AGUIRunner:
                         result=self._last_state,
                     )
                 )
-
+                if pending is not None:
+                    packet, pending = pending + packet, None
+                yield packet
+
+            # RUN_FINISHED has already been flushed to the client at this
+            # point. The save stays awaited rather than detached: under WSGI
+            # each request runs on its own short-lived event loop, and a
+            # background task would be dropped when that loop closes.
             await self._persist_state(
                 state_backend,
                 thread_id=prepared_input.thread_id,
@@ -619,14 +1195,17 @@ class AGUIRunner:
 
         except Exception as exc:
             logger.exception("Error during agent execution")
-            yield self.encoder.encode(self._build_error_event(exc))
+            packet = encode(self._build_error_event(exc))
+            if pending is not None:
+                packet = pending + packet
+            yield packet
 
     async def collect(self, input_data: RunAgentInput) -> AGUICollectedRun:
         """Collect AG-UI events for non-streaming responses."""
         prepared_input, state_backend = await prepare_input(
             input_data,
             self.request,
-            self.get_system_message,
+            self._get_system_message_fn,
         )
         self._last_state = prepared_input.state
 
@@ -643,13 +1222,12 @@ class AGUIRunner:
                     )
                 )
 
+            agent_events = self._iter_events(prepared_input)
             if self.config.timeout > 0:
                 async with asyncio.timeout(self.config.timeout):
-                    async for event in self._iter_events(prepared_input):
-                        events.append(event)
+                    events.extend([event async for event in agent_events])
             else:
-                async for event in self._iter_events(prepared_input):
-                    events.append(event)
+                events.extend([event async for event in agent_events])
 
             if self.config.emit_run_lifecycle_events:
                 events.append(
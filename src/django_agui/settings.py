@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from django.conf import settings
@@ -13,9 +16,12 @@ DEFAULTS: dict[str, Any] = {
     "STATE_BACKEND": None,
     "USE_DB_STORAGE": False,
     "REQUIRE_AUTHENTICATION": False,
+    "AUTH_CACHE_TTL": 0,
     "ALLOWED_ORIGINS": None,
+    "CORS_PREFLIGHT_MAX_AGE": 600,
     "SSE_KEEPALIVE_INTERVAL": 30,
     "SSE_TIMEOUT": 300,
+    "SSE_BATCH_BYTES": 4096,
     "EMIT_RUN_LIFECYCLE_EVENTS": True,
     "ERROR_DETAIL_POLICY": "auto",
     "STATE_SAVE_POLICY": "always",
@@ -24,9 +30,14 @@ DEFAULTS: dict[str, Any] = {
 }
 
 
-def get_agui_settings() -> dict[str, Any]:
+# Returned when ``settings.AGUI`` is undefined, so callers caching on the
+# settings object's identity see the same object every time.
+_NO_AGUI_SETTINGS: Mapping[str, Any] = MappingProxyType({})
+
+
+def get_agui_settings() -> Mapping[str, Any]:
     """Return the AGUI settings dictionary from Django settings."""
-    return getattr(settings, "AGUI", {})
+    return getattr(settings, "AGUI", _NO_AGUI_SETTINGS)
 
 
 def get_setting(key: str, default: Any = None) -> Any:
@@ -35,13 +46,19 @@ def get_setting(key: str, default: Any = None) -> Any:
     return agui_settings.get(key, DEFAULTS.get(key, default))
 
 
+@lru_cache(maxsize=32)
+def _import_backend(backend_ref: str) -> Any:
+    """Import a dotted backend path once; keyed by the path itself."""
+    return import_string(backend_ref)
+
+
 def get_backend_class(setting_key: str) -> type | None:
     """Resolve a backend class from AGUI settings."""
     backend_ref = get_setting(setting_key)
     if backend_ref is None:
         return None
     if isinstance(backend_ref, str):
-        return import_string(backend_ref)
+        return _import_backend(backend_ref)
     if isinstance(backend_ref, type):
         return backend_ref
     raise TypeError(
@@ -9,7 +9,7 @@ from datetime import UTC, datetime
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Thread:
     """AG-UI conversation thread."""
 
@@ -20,7 +20,7 @@ class Thread:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Run:
     """AG-UI agent run."""
 
@@ -34,7 +34,7 @@ class Run:
     finished_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """AG-UI message."""
 
@@ -50,7 +50,7 @@ class Message:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """AG-UI tool call."""
 
@@ -65,7 +65,7 @@ class ToolCall:
     finished_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """AG-UI event (for debugging/replay)."""
 
@@ -117,9 +117,17 @@ class RunStorage(ABC):
 
     @abstractmethod
     async def list_runs(
-        self, thread_id: str, limit: int = 100, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[Run]:
-        """List runs for a thread."""
+        """List runs for a thread, newest first.
+
+        Pass the last run's ``(started_at, id)`` as ``after`` to fetch the
+        next page without an ``OFFSET`` scan.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -143,9 +151,17 @@ class MessageStorage(ABC):
 
     @abstractmethod
     async def list_messages(
-        self, thread_id: str, limit: int = 1000, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int = 1000,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[Message]:
-        """List messages for a thread."""
+        """List messages for a thread.
+
+        Pass the last message's ``(created_at, id)`` as ``after`` to fetch
+        the next page without an ``OFFSET`` scan.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -155,6 +171,48 @@ class MessageStorage(ABC):
         """Stream messages for a thread."""
         raise NotImplementedError
 
+    async def get_messages(self, message_ids: list[str]) -> dict[str, Message]:
+        """Get several messages by ID, keyed by ID.
+
+        IDs with no matching message are left out. The default calls
+        ``get_message`` per ID; backends can override it with one query.
+        """
+        messages = {}
+        for message_id in message_ids:
+            message = await self.get_message(message_id)
+            if message is not None:
+                messages[message_id] = message
+        return messages
+
+    async def count_messages(self, thread_id: str) -> int:
+        """Count messages for a thread.
+
+        The default pages through ``list_messages``; backends can override it
+        with a cheaper count.
+        """
+        count = 0
+        page_size = 1000
+        while True:
+            page = await self.list_messages(thread_id, limit=page_size, offset=count)
+            count += len(page)
+            if len(page) < page_size:
+                return count
+
+    async def iter_messages(
+        self,
+        thread_id: str,
+        limit: int = 1000,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+    ) -> AsyncIterator[Message]:
+        """Stream messages for a thread.
+
+        The default yields from ``list_messages``; backends can override it to
+        avoid holding the whole page in memory.
+        """
+        for message in await self.list_messages(thread_id, limit, offset, after):
+            yield message
+
 
 class ToolCallStorage(ABC):
     """Abstract base class for tool call storage."""
@@ -171,9 +229,17 @@ class ToolCallStorage(ABC):
 
     @abstractmethod
     async def list_tool_calls(
-        self, run_id: str, limit: int = 100, offset: int = 0
+        self,
+        run_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[ToolCall]:
-        """List tool calls for a run."""
+        """List tool calls for a run.
+
+        Pass the last tool call's ``(started_at, id)`` as ``after`` to fetch
+        the next page without an ``OFFSET`` scan.
+        """
         raise NotImplementedError
 
 
@@ -187,9 +253,17 @@ class EventStorage(ABC):
 
     @abstractmethod
     async def list_events(
-        self, run_id: str, limit: int = 1000, offset: int = 0
+        self,
+        run_id: str,
+        limit: int = 1000,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[Event]:
-        """List events for a run."""
+        """List events for a run.
+
+        Pass the last event's ``(created_at, id)`` as ``after`` to fetch the
+        next page without an ``OFFSET`` scan.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -211,13 +285,13 @@ class FileStorage(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_file(self, file_id: str) -> bytes | None:
-        """Get file content by ID."""
+    async def get_file(self, file_id: str, filename: str | None = None) -> bytes | None:
+        """Get file content by ID, optionally with the name it was saved as."""
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_file(self, file_id: str) -> bool:
-        """Delete a file."""
+    async def delete_file(self, file_id: str, filename: str | None = None) -> bool:
+        """Delete a file, optionally with the name it was saved as."""
         raise NotImplementedError
 
 
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
 from asgiref.sync import sync_to_async
+from django.core.cache import cache
 from django.core.files.base import ContentFile
-from django.db import transaction
+from django.core.files.storage import default_storage
+from django.db import connections, router, transaction
+from django.db.models import Exists, Model, Q, QuerySet, Subquery
 from django.utils import timezone
 
 from django_agui.storage.base import (
@@ -26,15 +33,125 @@ from django_agui.storage.base import (
 )
 from django_agui import models as django_models
 
+# Column names matching the storage dataclass fields, so queries can use
+# ``.values()`` to select only these columns and skip building ORM model
+# instances per row.
+_THREAD_FIELDS = ("id", "user_id", "created_at", "updated_at", "metadata")
+_RUN_FIELDS = (
+    "id",
+    "thread_id",
+    "parent_run_id",
+    "status",
+    "input_data",
+    "output_state",
+    "started_at",
+    "finished_at",
+)
+_MESSAGE_FIELDS = (
+    "id",
+    "thread_id",
+    "run_id",
+    "role",
+    "content",
+    "content_type",
+    "mime_type",
+    "file_url",
+    "metadata",
+    "created_at",
+)
+_TOOL_CALL_FIELDS = (
+    "id",
+    "run_id",
+    "message_id",
+    "tool_name",
+    "arguments",
+    "result",
+    "status",
+    "started_at",
+    "finished_at",
+)
+_EVENT_FIELDS = ("id", "run_id", "event_type", "data", "created_at")
+
+# Message counts are only cached for long threads, where COUNT(*) dominates
+# the cost of paging; short threads are cheap enough to count every time.
+_MESSAGE_COUNT_CACHE_THRESHOLD = 1000
+_MESSAGE_COUNT_CACHE_TTL = 60
+
+# Runs whose last non-terminal status update is remembered per process.
+_RUN_STATUS_CACHE_MAXSIZE = 1024
+_TERMINAL_RUN_STATUSES = frozenset({"completed", "failed"})
+
+# Rows fetched per round-trip when streaming large result sets, so only one
+# chunk of JSON payloads is held in memory at a time.
+_ITER_CHUNK_SIZE = 200
+
+
+def _message_count_key(thread_id: str) -> str:
+    return f"agui:msgcount:{thread_id}"
+
+
+def _after_cursor(
+    queryset: QuerySet,
+    field: str,
+    after: tuple[datetime, str] | None,
+    *,
+    descending: bool = False,
+) -> QuerySet:
+    """Restrict ``queryset`` to rows past a ``(timestamp, id)`` keyset cursor."""
+    if after is None:
+        return queryset
+    value, pk = after
+    op = "lt" if descending else "gt"
+    return queryset.filter(
+        Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"id__{op}": pk})
+    )
+
+
+async def _upsert(model: type[Model], pk: str, defaults: dict[str, Any]) -> None:
+    """Insert or update the ``pk`` row, in one statement where the DB allows.
+
+    Falls back to ``update_or_create`` (SELECT then UPDATE/INSERT) on
+    backends without ``INSERT ... ON CONFLICT`` support.
+    """
+    features = connections[router.db_for_write(model)].features
+    if not features.supports_update_conflicts:
+        await model.objects.aupdate_or_create(id=pk, defaults=defaults)
+        return
+    await model.objects.abulk_create(
+        [model(id=pk, **defaults)],
+        update_conflicts=True,
+        update_fields=list(defaults),
+        unique_fields=(
+            ["id"] if features.supports_update_conflicts_with_target else None
+        ),
+    )
+
+
+def _pivot_filter(queryset: QuerySet, pivot: QuerySet, op: str) -> QuerySet:
+    """Filter ``queryset`` on ``created_at`` relative to ``pivot`` in the same query.
+
+    An unknown pivot id leaves the queryset unfiltered, as before.
+    """
+    return queryset.filter(
+        Q(**{f"created_at__{op}": Subquery(pivot.values("created_at")[:1])})
+        | ~Exists(pivot)
+    )
+
+
+def _message_from_row(row: dict[str, Any]) -> Message:
+    row["file_url"] = row["file_url"] or None
+    return Message(**row)
+
 
 class DjangoThreadStorage(ThreadStorage):
     """Django ORM thread storage implementation."""
 
     async def save_thread(self, thread: Thread) -> None:
         """Save or update a thread."""
-        await sync_to_async(django_models.Thread.objects.update_or_create)(
-            id=thread.id,
-            defaults={
+        await _upsert(
+            django_models.Thread,
+            thread.id,
+            {
                 "user_id": thread.user_id,
                 "created_at": thread.created_at,
                 "updated_at": thread.updated_at,
@@ -45,18 +162,12 @@ class DjangoThreadStorage(ThreadStorage):
     async def get_thread(self, thread_id: str) -> Thread | None:
         """Get a thread by ID."""
         try:
-            django_thread = await sync_to_async(
-                django_models.Thread.objects.select_related("user").get
-            )(id=thread_id)
-            return Thread(
-                id=django_thread.id,
-                user_id=django_thread.user_id,
-                created_at=django_thread.created_at,
-                updated_at=django_thread.updated_at,
-                metadata=django_thread.metadata,
+            row = await django_models.Thread.objects.values(*_THREAD_FIELDS).aget(
+                id=thread_id
             )
         except django_models.Thread.DoesNotExist:
             return None
+        return Thread(**row)
 
     async def list_threads(
         self, user_id: str | None = None, limit: int = 100, offset: int = 0
@@ -66,39 +177,44 @@ class DjangoThreadStorage(ThreadStorage):
         if user_id:
             queryset = queryset.filter(user_id=user_id)
 
-        django_threads = await sync_to_async(list)(
-            queryset.order_by("-updated_at")[offset : offset + limit]
-        )
-
         return [
-            Thread(
-                id=t.id,
-                user_id=t.user_id,
-                created_at=t.created_at,
-                updated_at=t.updated_at,
-                metadata=t.metadata,
-            )
-            for t in django_threads
+            Thread(**row)
+            async for row in queryset.order_by("-updated_at").values(*_THREAD_FIELDS)[
+                offset : offset + limit
+            ]
         ]
 
     async def delete_thread(self, thread_id: str) -> bool:
         """Delete thread and all associated data."""
         try:
-            thread = await sync_to_async(django_models.Thread.objects.get)(id=thread_id)
-            await sync_to_async(thread.delete)()
+            thread = await django_models.Thread.objects.aget(id=thread_id)
+            await thread.adelete()
+            await cache.adelete(_message_count_key(thread_id))
             return True
         except django_models.Thread.DoesNotExist:
             return False
 
 
 class DjangoRunStorage(RunStorage):
-    """Django ORM run storage implementation."""
+    """Django ORM run storage implementation.
+
+    ``update_run_status`` skips the UPDATE when this instance already wrote
+    the same non-terminal status for the run, assuming a run's status is
+    only driven from the process that executes it.
+    """
+
+    def __init__(self) -> None:
+        self._last_status: OrderedDict[str, str] = OrderedDict()
+        self._last_status_lock = threading.Lock()
 
     async def save_run(self, run: Run) -> None:
         """Save or update a run."""
-        await sync_to_async(django_models.Run.objects.update_or_create)(
-            id=run.id,
-            defaults={
+        with self._last_status_lock:
+            self._last_status.pop(run.id, None)
+        await _upsert(
+            django_models.Run,
+            run.id,
+            {
                 "thread_id": run.thread_id,
                 "parent_run_id": run.parent_run_id,
                 "status": run.status,
@@ -112,62 +228,60 @@ class DjangoRunStorage(RunStorage):
     async def get_run(self, run_id: str) -> Run | None:
         """Get a run by ID."""
         try:
-            django_run = await sync_to_async(django_models.Run.objects.get)(id=run_id)
-            return Run(
-                id=django_run.id,
-                thread_id=django_run.thread_id,
-                parent_run_id=django_run.parent_run_id,
-                status=django_run.status,
-                input_data=django_run.input_data,
-                output_state=django_run.output_state,
-                started_at=django_run.started_at,
-                finished_at=django_run.finished_at,
-            )
+            row = await django_models.Run.objects.values(*_RUN_FIELDS).aget(id=run_id)
         except django_models.Run.DoesNotExist:
             return None
+        return Run(**row)
 
     async def list_runs(
-        self, thread_id: str, limit: int = 100, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[Run]:
-        """List runs for a thread."""
-        django_runs = await sync_to_async(list)(
-            django_models.Run.objects.filter(thread_id=thread_id).order_by(
-                "-started_at"
-            )[offset : offset + limit]
+        """List runs for a thread, newest first."""
+        queryset = _after_cursor(
+            django_models.Run.objects.filter(thread_id=thread_id),
+            "started_at",
+            after,
+            descending=True,
         )
-
         return [
-            Run(
-                id=r.id,
-                thread_id=r.thread_id,
-                parent_run_id=r.parent_run_id,
-                status=r.status,
-                input_data=r.input_data,
-                output_state=r.output_state,
-                started_at=r.started_at,
-                finished_at=r.finished_at,
-            )
-            for r in django_runs
+            Run(**row)
+            async for row in queryset.order_by("-started_at", "-id").values(
+                *_RUN_FIELDS
+            )[offset : offset + limit]
         ]
 
     async def update_run_status(self, run_id: str, status: str) -> None:
         """Update run status."""
-        finished_at = None
-        if status in ("completed", "failed"):
-            finished_at = timezone.now()
-
-        await sync_to_async(django_models.Run.objects.filter(id=run_id).update)(
+        terminal = status in _TERMINAL_RUN_STATUSES
+        with self._last_status_lock:
+            if terminal:
+                self._last_status.pop(run_id, None)
+            elif self._last_status.get(run_id) == status:
+                self._last_status.move_to_end(run_id)
+                return
+
+        await django_models.Run.objects.filter(id=run_id).aupdate(
             status=status,
-            finished_at=finished_at,
+            finished_at=timezone.now() if terminal else None,
         )
 
+        if not terminal:
+            with self._last_status_lock:
+                self._last_status[run_id] = status
+                if len(self._last_status) > _RUN_STATUS_CACHE_MAXSIZE:
+                    self._last_status.popitem(last=False)
+
 
 class DjangoMessageStorage(MessageStorage):
     """Django ORM message storage implementation."""
 
     async def save_message(self, message: Message) -> None:
         """Save a message."""
-        await sync_to_async(django_models.Message.objects.create)(
+        await django_models.Message.objects.acreate(
             id=message.id,
             thread_id=message.thread_id,
             run_id=message.run_id,
@@ -179,54 +293,92 @@ class DjangoMessageStorage(MessageStorage):
             metadata=message.metadata,
             created_at=message.created_at,
         )
+        await cache.adelete(_message_count_key(message.thread_id))
+
+    async def count_messages(self, thread_id: str) -> int:
+        """Count messages for a thread.
+
+        Counts above ``_MESSAGE_COUNT_CACHE_THRESHOLD`` are cached for
+        ``_MESSAGE_COUNT_CACHE_TTL`` seconds and dropped on every new message.
+        """
+        key = _message_count_key(thread_id)
+        count = await cache.aget(key)
+        if count is None:
+            count = await django_models.Message.objects.filter(
+                thread_id=thread_id
+            ).acount()
+            if count > _MESSAGE_COUNT_CACHE_THRESHOLD:
+                await cache.aset(key, count, _MESSAGE_COUNT_CACHE_TTL)
+        return count
 
     async def get_message(self, message_id: str) -> Message | None:
         """Get a message by ID."""
         try:
-            django_msg = await sync_to_async(django_models.Message.objects.get)(
+            row = await django_models.Message.objects.values(*_MESSAGE_FIELDS).aget(
                 id=message_id
             )
-            return Message(
-                id=django_msg.id,
-                thread_id=django_msg.thread_id,
-                run_id=django_msg.run_id,
-                role=django_msg.role,
-                content=django_msg.content,
-                content_type=django_msg.content_type,
-                mime_type=django_msg.mime_type,
-                file_url=django_msg.file_url or None,
-                metadata=django_msg.metadata,
-                created_at=django_msg.created_at,
-            )
         except django_models.Message.DoesNotExist:
             return None
+        return _message_from_row(row)
+
+    async def get_messages(self, message_ids: list[str]) -> dict[str, Message]:
+        """Get several messages by ID in one query, keyed by ID.
+
+        IDs with no matching message are left out of the result.
+        """
+        if not message_ids:
+            return {}
+        return {
+            row["id"]: _message_from_row(row)
+            async for row in django_models.Message.objects.filter(
+                id__in=message_ids
+            ).values(*_MESSAGE_FIELDS)
+        }
 
     async def list_messages(
-        self, thread_id: str, limit: int = 1000, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int = 1000,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[Message]:
         """List messages for a thread."""
-        django_messages = await sync_to_async(list)(
-            django_models.Message.objects.filter(thread_id=thread_id).order_by(
-                "created_at"
-            )[offset : offset + limit]
+        queryset = _after_cursor(
+            django_models.Message.objects.filter(thread_id=thread_id),
+            "created_at",
+            after,
         )
-
         return [
-            Message(
-                id=m.id,
-                thread_id=m.thread_id,
-                run_id=m.run_id,
-                role=m.role,
-                content=m.content,
-                content_type=m.content_type,
-                mime_type=m.mime_type,
-                file_url=m.file_url or None,
-                metadata=m.metadata,
-                created_at=m.created_at,
-            )
-            for m in django_messages
+            _message_from_row(row)
+            async for row in queryset.order_by("created_at", "id").values(
+                *_MESSAGE_FIELDS
+            )[offset : offset + limit]
         ]
 
+    async def iter_messages(
+        self,
+        thread_id: str,
+        limit: int = 1000,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+    ) -> AsyncIterator[Message]:
+        """Stream messages for a thread in chunks of ``_ITER_CHUNK_SIZE`` rows.
+
+        Prefer ``list_messages`` when the whole page is needed at once; this
+        costs one round-trip per chunk but holds only one chunk in memory.
+        """
+        queryset = _after_cursor(
+            django_models.Message.objects.filter(thread_id=thread_id),
+            "created_at",
+            after,
+        )
+        async for row in (
+            queryset.order_by("created_at", "id")
+            .values(*_MESSAGE_FIELDS)[offset : offset + limit]
+            .aiterator(chunk_size=_ITER_CHUNK_SIZE)
+        ):
+            yield _message_from_row(row)
+
     async def get_thread_messages(
         self, thread_id: str, before_id: str | None = None, limit: int = 1000
     ) -> AsyncIterator[Message]:
@@ -234,31 +386,19 @@ class DjangoMessageStorage(MessageStorage):
         queryset = django_models.Message.objects.filter(thread_id=thread_id)
 
         if before_id:
-            try:
-                before_msg = await sync_to_async(django_models.Message.objects.get)(
-                    id=before_id
-                )
-                queryset = queryset.filter(created_at__lt=before_msg.created_at)
-            except django_models.Message.DoesNotExist:
-                pass
+            queryset = _pivot_filter(
+                queryset, django_models.Message.objects.filter(id=before_id), "lt"
+            )
 
-        django_messages = await sync_to_async(list)(
-            queryset.order_by("-created_at")[:limit]
-        )
+        rows = [
+            row
+            async for row in queryset.order_by("-created_at").values(*_MESSAGE_FIELDS)[
+                :limit
+            ]
+        ]
 
-        for django_msg in reversed(django_messages):
-            yield Message(
-                id=django_msg.id,
-                thread_id=django_msg.thread_id,
-                run_id=django_msg.run_id,
-                role=django_msg.role,
-                content=django_msg.content,
-                content_type=django_msg.content_type,
-                mime_type=django_msg.mime_type,
-                file_url=django_msg.file_url or None,
-                metadata=django_msg.metadata,
-                created_at=django_msg.created_at,
-            )
+        for row in reversed(rows):
+            yield _message_from_row(row)
 
 
 class DjangoToolCallStorage(ToolCallStorage):
@@ -266,9 +406,10 @@ class DjangoToolCallStorage(ToolCallStorage):
 
     async def save_tool_call(self, tool_call: ToolCall) -> None:
         """Save or update a tool call."""
-        await sync_to_async(django_models.ToolCall.objects.update_or_create)(
-            id=tool_call.id,
-            defaults={
+        await _upsert(
+            django_models.ToolCall,
+            tool_call.id,
+            {
                 "run_id": tool_call.run_id,
                 "message_id": tool_call.message_id,
                 "tool_name": tool_call.tool_name,
@@ -283,123 +424,120 @@ class DjangoToolCallStorage(ToolCallStorage):
     async def get_tool_call(self, tool_call_id: str) -> ToolCall | None:
         """Get a tool call by ID."""
         try:
-            django_tc = await sync_to_async(django_models.ToolCall.objects.get)(
+            row = await django_models.ToolCall.objects.values(*_TOOL_CALL_FIELDS).aget(
                 id=tool_call_id
             )
-            return ToolCall(
-                id=django_tc.id,
-                run_id=django_tc.run_id,
-                message_id=django_tc.message_id,
-                tool_name=django_tc.tool_name,
-                arguments=django_tc.arguments,
-                result=django_tc.result,
-                status=django_tc.status,
-                started_at=django_tc.started_at,
-                finished_at=django_tc.finished_at,
-            )
         except django_models.ToolCall.DoesNotExist:
             return None
+        return ToolCall(**row)
 
     async def list_tool_calls(
-        self, run_id: str, limit: int = 100, offset: int = 0
+        self,
+        run_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[ToolCall]:
         """List tool calls for a run."""
-        django_tool_calls = await sync_to_async(list)(
-            django_models.ToolCall.objects.filter(run_id=run_id).order_by("started_at")[
-                offset : offset + limit
-            ]
+        queryset = _after_cursor(
+            django_models.ToolCall.objects.filter(run_id=run_id),
+            "started_at",
+            after,
         )
-
         return [
-            ToolCall(
-                id=tc.id,
-                run_id=tc.run_id,
-                message_id=tc.message_id,
-                tool_name=tc.tool_name,
-                arguments=tc.arguments,
-                result=tc.result,
-                status=tc.status,
-                started_at=tc.started_at,
-                finished_at=tc.finished_at,
-            )
-            for tc in django_tool_calls
+            ToolCall(**row)
+            async for row in queryset.order_by("started_at", "id").values(
+                *_TOOL_CALL_FIELDS
+            )[offset : offset + limit]
         ]
 
 
 class DjangoEventStorage(EventStorage):
-    """Django ORM event storage implementation."""
+    """Django ORM event storage implementation.
+
+    With ``batch_size`` above 1, ``save_event`` buffers events and writes them
+    with one ``bulk_create`` per batch. Reads and ``close()`` flush first, so
+    buffered events are never missing from query results.
+    """
+
+    def __init__(self, batch_size: int = 1) -> None:
+        self._batch_size = max(1, batch_size)
+        self._pending: list[django_models.Event] = []
+        self._pending_lock = threading.Lock()
 
     async def save_event(self, event: Event) -> None:
         """Save an event."""
-        await sync_to_async(django_models.Event.objects.create)(
+        obj = django_models.Event(
             id=event.id,
             run_id=event.run_id,
             event_type=event.event_type,
             data=event.data,
             created_at=event.created_at,
         )
+        with self._pending_lock:
+            self._pending.append(obj)
+            if len(self._pending) < self._batch_size:
+                return
+            pending, self._pending = self._pending, []
+        await django_models.Event.objects.abulk_create(pending, batch_size=500)
+
+    async def flush(self) -> None:
+        """Write any buffered events."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            await django_models.Event.objects.abulk_create(pending, batch_size=500)
 
     async def list_events(
-        self, run_id: str, limit: int = 1000, offset: int = 0
+        self,
+        run_id: str,
+        limit: int = 1000,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[Event]:
         """List events for a run."""
-        django_events = await sync_to_async(list)(
-            django_models.Event.objects.filter(run_id=run_id).order_by("created_at")[
-                offset : offset + limit
-            ]
+        await self.flush()
+        queryset = _after_cursor(
+            django_models.Event.objects.filter(run_id=run_id),
+            "created_at",
+            after,
         )
-
         return [
-            Event(
-                id=e.id,
-                run_id=e.run_id,
-                event_type=e.event_type,
-                data=e.data,
-                created_at=e.created_at,
-            )
-            for e in django_events
+            Event(**row)
+            async for row in queryset.order_by("created_at", "id").values(
+                *_EVENT_FIELDS
+            )[offset : offset + limit]
         ]
 
     async def get_events_for_run(
         self, run_id: str, after_id: str | None = None
     ) -> AsyncIterator[Event]:
         """Stream events for a run."""
+        await self.flush()
         queryset = django_models.Event.objects.filter(run_id=run_id)
 
         if after_id:
-            try:
-                after_event = await sync_to_async(django_models.Event.objects.get)(
-                    id=after_id
-                )
-                queryset = queryset.filter(created_at__gt=after_event.created_at)
-            except django_models.Event.DoesNotExist:
-                pass
-
-        django_events = await sync_to_async(list)(queryset.order_by("created_at"))
-
-        for e in django_events:
-            yield Event(
-                id=e.id,
-                run_id=e.run_id,
-                event_type=e.event_type,
-                data=e.data,
-                created_at=e.created_at,
+            queryset = _pivot_filter(
+                queryset, django_models.Event.objects.filter(id=after_id), "gt"
             )
 
+        async for row in (
+            queryset.order_by("created_at")
+            .values(*_EVENT_FIELDS)
+            .aiterator(chunk_size=_ITER_CHUNK_SIZE)
+        ):
+            yield Event(**row)
 
-class DjangoFileStorage(FileStorage):
-    """Django file storage implementation using MEDIA_ROOT."""
 
-    def __init__(self) -> None:
-        self._storage = None
+class DjangoFileStorage(FileStorage):
+    """Django file storage implementation using MEDIA_ROOT.
 
-    def _get_storage(self):
-        """Lazy load storage to avoid import issues."""
-        if self._storage is None:
-            from django.core.files.storage import default_storage
+    Storage calls touch no ORM state, so they run via ``asyncio.to_thread``
+    rather than the thread-sensitive ``sync_to_async`` executor.
+    """
 
-            self._storage = default_storage
-        return self._storage
+    def __init__(self) -> None:
+        self._storage = default_storage
 
     async def save_file(
         self, file_id: str, content: bytes, mime_type: str, filename: str | None = None
@@ -412,21 +550,31 @@ class DjangoFileStorage(FileStorage):
         path = f"agui/{file_id}/{filename}"
 
         content_file = ContentFile(content)
-        storage = self._get_storage()
+        storage = self._storage
 
         # Save file
-        saved_path = await sync_to_async(storage.save)(path, content_file)
+        saved_path = await asyncio.to_thread(storage.save, path, content_file)
 
         # Return URL
-        return await sync_to_async(storage.url)(saved_path)
+        return await asyncio.to_thread(storage.url, saved_path)
+
+    async def get_file(self, file_id: str, filename: str | None = None) -> bytes | None:
+        """Get file content by ID.
 
-    async def get_file(self, file_id: str) -> bytes | None:
-        """Get file content by ID."""
-        storage = self._get_storage()
+        The file is opened directly at the path ``save_file`` used for
+        ``filename`` (default: ``file_id``); the directory is only listed if
+        nothing is there, e.g. when the storage renamed the file on save.
+        """
+        storage = self._storage
         base_path = f"agui/{file_id}"
+        direct_path = f"{base_path}/{filename or file_id}"
 
-        @sync_to_async
         def _read_first_file() -> bytes | None:
+            try:
+                with storage.open(direct_path, "rb") as file_handle:
+                    return file_handle.read()
+            except Exception:
+                pass
             try:
                 _, files = storage.listdir(base_path)
                 if not files:
@@ -437,34 +585,47 @@ class DjangoFileStorage(FileStorage):
             except Exception:
                 return None
 
-        return await _read_first_file()
+        return await asyncio.to_thread(_read_first_file)
 
-    async def delete_file(self, file_id: str) -> bool:
-        """Delete a file."""
-        storage = self._get_storage()
+    async def delete_file(self, file_id: str, filename: str | None = None) -> bool:
+        """Delete a file and anything else stored under its ID.
+
+        The path ``save_file`` used is deleted directly; the directory is
+        then cleared of copies the storage renamed on a name collision.
+        """
+        storage = self._storage
         base_path = f"agui/{file_id}"
+        direct_path = f"{base_path}/{filename or file_id}"
 
-        @sync_to_async
         def _delete_all() -> bool:
+            deleted_any = False
+            try:
+                if storage.exists(direct_path):
+                    storage.delete(direct_path)
+                    deleted_any = True
+            except Exception:
+                pass
             try:
                 _, files = storage.listdir(base_path)
             except Exception:
-                return False
+                return deleted_any
 
-            deleted_any = False
             for filename in files:
                 storage.delete(f"{base_path}/{filename}")
                 deleted_any = True
             return deleted_any
 
-        return await _delete_all()
+        return await asyncio.to_thread(_delete_all)
 
 
 class DjangoStorageBackend(AGUIStorageBackend):
     """Complete Django ORM storage backend for AG-UI protocol."""
 
     def __init__(
-        self, enable_event_storage: bool = False, enable_file_storage: bool = True
+        self,
+        enable_event_storage: bool = False,
+        enable_file_storage: bool = True,
+        event_batch_size: int = 1,
     ) -> None:
         super().__init__()
         self.threads = DjangoThreadStorage()
@@ -476,7 +637,7 @@ class DjangoStorageBackend(AGUIStorageBackend):
         self._enable_file_storage = enable_file_storage
 
         if enable_event_storage:
-            self.events = DjangoEventStorage()
+            self.events = DjangoEventStorage(batch_size=event_batch_size)
         else:
             self.events = None
 
@@ -494,28 +655,34 @@ class DjangoStorageBackend(AGUIStorageBackend):
     async def close(self) -> None:
         """Close the storage backend."""
         # Django ORM connections are managed automatically
-        pass
+        if self.events is not None:
+            await self.events.flush()
 
     async def save_conversation_snapshot(
         self, thread_id: str, run_id: str, messages: list[Message]
     ) -> None:
         """Save all messages from a conversation in a transaction."""
+        objs = [
+            django_models.Message(
+                id=message.id,
+                thread_id=message.thread_id,
+                run_id=message.run_id,
+                role=message.role,
+                content=message.content,
+                content_type=message.content_type,
+                mime_type=message.mime_type,
+                file_url=message.file_url or "",
+                metadata=message.metadata,
+                created_at=message.created_at,
+            )
+            for message in messages
+        ]
 
         @sync_to_async
         def _save_all():
             with transaction.atomic():
-                for message in messages:
-                    django_models.Message.objects.create(
-                        id=message.id,
-                        thread_id=message.thread_id,
-                        run_id=message.run_id,
-                        role=message.role,
-                        content=message.content,
-                        content_type=message.content_type,
-                        mime_type=message.mime_type,
-                        file_url=message.file_url or "",
-                        metadata=message.metadata,
-                        created_at=message.created_at,
-                    )
+                django_models.Message.objects.bulk_create(objs, batch_size=500)
 
         await _save_all()
+        thread_ids = {thread_id, *(message.thread_id for message in messages)}
+        await cache.adelete_many([_message_count_key(tid) for tid in thread_ids])
@@ -27,10 +27,10 @@ GetSystemMessageFunc = Callable[[Any], str | None | Awaitable[str | None]]
 class EventEncoder(Protocol):
     """Protocol for event encoders."""
 
-    def encode(self, event: BaseEvent) -> str:
-        """Encode an event to string format."""
+    def encode(self, event: BaseEvent) -> str | bytes:
+        """Encode an event to a ``str`` or UTF-8 ``bytes`` packet."""
 
-    def encode_keepalive(self) -> str:
+    def encode_keepalive(self) -> str | bytes:
         """Encode a keepalive packet."""
 
 
@@ -78,6 +78,7 @@ class AGUIRouter:
 
     def __init__(self) -> None:
         self._routes: list[AgentRoute] = []
+        self._urlpatterns: list | None = None
 
     def register(
         self,
@@ -92,6 +93,7 @@ class AGUIRouter:
         state_save_policy: str | None = None,
     ) -> None:
         """Register an AG-UI endpoint."""
+        self._urlpatterns = None
         self._routes.append(
             AgentRoute(
                 path_prefix=path_prefix,
@@ -132,8 +134,14 @@ class AGUIRouter:
 
     @property
     def urls(self) -> list:
-        """Return all registered URL patterns."""
-        return [self.get_urlpattern(route) for route in self._routes]
+        """Return all registered URL patterns.
+
+        Patterns are built once and reused until another route is
+        registered.
+        """
+        if self._urlpatterns is None:
+            self._urlpatterns = [self.get_urlpattern(route) for route in self._routes]
+        return list(self._urlpatterns)
 
 
 class MultiAgentRouter(AGUIRouter):
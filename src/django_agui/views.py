@@ -2,23 +2,23 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 import logging
 from typing import Any
 
 from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
-from django.utils.decorators import method_decorator
 from django.views import View
-from django.views.decorators.csrf import csrf_exempt
 
 from django_agui.runtime import (
     AGUIRequestError,
     AGUIRunner,
+    aenforce_origin_and_auth,
     enforce_max_content_length,
-    enforce_origin_and_auth,
     ensure_json_content_type,
+    freeze_allowed_origins,
     get_cors_headers,
+    get_preflight_cache_headers,
     get_request_origin,
     parse_run_input_json,
     resolve_allowed_origins,
@@ -27,7 +27,6 @@ from django_agui.runtime import (
 logger = logging.getLogger(__name__)
 
 
-@method_decorator(csrf_exempt, name="dispatch")
 class AGUIView(View):
     """Main Django AG-UI view.
 
@@ -41,11 +40,33 @@ class AGUIView(View):
     translate_event: Callable[[Any], Any] | None = None
     get_system_message: Callable[[Any], str | None] | None = None
     auth_required: bool = False
-    allowed_origins: list[str] | None = None
+    allowed_origins: list[str] | tuple[str, ...] | None = None
     emit_run_lifecycle_events: bool | None = None
     error_detail_policy: str | None = None
     state_save_policy: str | None = None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Freeze a class-level ``allowed_origins`` list."""
+        super().__init_subclass__(**kwargs)
+        if "allowed_origins" in cls.__dict__:
+            cls.allowed_origins = freeze_allowed_origins(cls.allowed_origins)
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any):
+        """Build the CSRF-exempt view callable.
+
+        A per-route ``allowed_origins`` list is frozen to a tuple. The view is
+        marked exempt directly, which is what ``csrf_exempt`` does, without
+        ``method_decorator`` re-wrapping ``dispatch`` on every request.
+        """
+        if "allowed_origins" in initkwargs:
+            initkwargs["allowed_origins"] = freeze_allowed_origins(
+                initkwargs["allowed_origins"]
+            )
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
     def get_run_agent(self, request: HttpRequest) -> Callable[..., Any] | None:
         """Return the agent callable for this request."""
         return self.run_agent
@@ -61,7 +82,7 @@ class AGUIView(View):
         """Return whether authentication is required."""
         return self.auth_required
 
-    def get_allowed_origins(self, request: HttpRequest) -> list[str] | None:
+    def get_allowed_origins(self, request: HttpRequest) -> tuple[str, ...] | None:
         """Resolve allowed CORS origins for this request."""
         return resolve_allowed_origins(self.allowed_origins)
 
@@ -93,7 +114,7 @@ class AGUIView(View):
         response: HttpResponse,
         *,
         origin: str | None,
-        allowed_origins: list[str] | None,
+        allowed_origins: Sequence[str] | None,
     ) -> None:
         """Apply CORS headers to the response."""
         for key, value in get_cors_headers(origin, allowed_origins).items():
@@ -120,7 +141,7 @@ class AGUIView(View):
         *,
         status: int,
         origin: str | None,
-        allowed_origins: list[str] | None,
+        allowed_origins: Sequence[str] | None,
     ) -> HttpResponse:
         """Build an error response with CORS headers."""
         response = HttpResponse(message, status=status, content_type="text/plain")
@@ -161,10 +182,11 @@ class AGUIView(View):
             )
 
         try:
-            origin, allowed_origins = enforce_origin_and_auth(
+            origin, allowed_origins = await aenforce_origin_and_auth(
                 request,
                 auth_required=self.get_auth_required(request),
                 allowed_origins=allowed_origins,
+                origin=origin,
             )
             input_data = self.parse_input(request)
             response = self.build_streaming_response(
@@ -213,4 +235,7 @@ class AGUIView(View):
             origin=origin,
             allowed_origins=allowed_origins,
         )
+        if "Access-Control-Allow-Origin" in response:
+            for key, value in get_preflight_cache_headers().items():
+                response[key] = value
         return response
@@ -4,7 +4,8 @@ import pytest
 
 pytest.importorskip("rest_framework")
 
-from ag_ui.core import EventType, TextMessageContentEvent
+from ag_ui.core import EventType, RunAgentInput, TextMessageContentEvent
+from django.test.client import AsyncRequestFactory
 
 from django_agui.contrib.drf import DRFBackend, create_drf_view, get_drf_urlpatterns
 
@@ -105,3 +106,43 @@ class TestDRFShortcuts:
 
         assert view_class is not None
         assert view_class.run_agent == dummy_agent
+
+    @pytest.mark.asyncio
+    async def test_rest_view_event_keys(self, settings):
+        """REST responses serialize events with snake_case keys."""
+        settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": False}
+
+        async def dummy_agent(input_data, request):
+            yield TextMessageContentEvent(
+                type=EventType.TEXT_MESSAGE_CONTENT,
+                message_id="msg-1",
+                delta="Hello",
+            )
+
+        view = create_drf_view(dummy_agent, streaming=False)()
+        body = RunAgentInput(
+            thread_id="thread-1",
+            run_id="run-1",
+            state=None,
+            messages=[],
+            tools=[],
+            context=[],
+            forwarded_props=None,
+        ).model_dump_json(by_alias=True)
+        request = view.initialize_request(
+            AsyncRequestFactory().post(
+                "/agent/", data=body, content_type="application/json"
+            )
+        )
+
+        response = await view._handle_post(request, streaming=False)
+
+        assert response.status_code == 200
+        assert response.data["thread_id"] == "thread-1"
+        assert response.data["events"] == [
+            {
+                "type": "TEXT_MESSAGE_CONTENT",
+                "message_id": "msg-1",
+                "delta": "Hello",
+            }
+        ]
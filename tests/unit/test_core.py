@@ -1,5 +1,8 @@
 """Unit tests for django-agui core functionality."""
 
+import asyncio
+import dataclasses
+
 from ag_ui.core import (
     EventType,
     TextMessageContentEvent,
@@ -10,6 +13,21 @@ import pytest
 
 from django_agui import VERSION
 from django_agui.encoders import SSEEventEncoder
+from django_agui.runtime import (
+    AGUIExecutionConfig,
+    AGUIRequestError,
+    _instantiate_backend,
+    aauthenticate_request,
+    aenforce_origin_and_auth,
+    authenticate_request,
+    build_event_encoder,
+    enforce_origin_and_auth,
+    get_cors_headers,
+    get_request_header,
+    invalidate_auth_cache,
+    parse_run_input_json,
+    setup_uvloop,
+)
 from django_agui.settings import get_agui_settings, get_backend_class, get_setting
 
 
@@ -38,9 +56,10 @@ class TestSSEEncoder:
         )
         encoded = encoder.encode(event)
 
-        assert encoded.startswith('data: {"')
-        assert "TEXT_MESSAGE_START" in encoded
-        assert "msg-1" in encoded
+        assert encoded.startswith(b'data: {"')
+        assert encoded.endswith(b"\n\n")
+        assert b"TEXT_MESSAGE_START" in encoded
+        assert b"msg-1" in encoded
 
     def test_encode_text_message_content(self):
         """Test encoding TEXT_MESSAGE_CONTENT event."""
@@ -52,16 +71,27 @@ class TestSSEEncoder:
         )
         encoded = encoder.encode(event)
 
-        assert encoded.startswith('data: {"')
-        assert "TEXT_MESSAGE_CONTENT" in encoded
-        assert "Hello world" in encoded
+        assert encoded.startswith(b'data: {"')
+        assert b"TEXT_MESSAGE_CONTENT" in encoded
+        assert b"Hello world" in encoded
+
+    def test_encode_matches_model_dump_json(self):
+        """Encoded payloads match pydantic's camelCase JSON output."""
+        encoder = SSEEventEncoder()
+        event = TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="héllo",
+        )
+        expected = event.model_dump_json(by_alias=True, exclude_none=True)
+        assert encoder.encode(event).decode("utf-8") == f"data: {expected}\n\n"
 
     def test_encode_keepalive(self):
         """Test encoding keepalive message."""
         encoder = SSEEventEncoder()
         encoded = encoder.encode_keepalive()
 
-        assert ": keepalive" in encoded
+        assert b": keepalive" in encoded
 
 
 class TestSettings:
@@ -109,6 +139,13 @@ class TestSettings:
         with pytest.raises(ImportError):
             get_backend_class("TEST_BACKEND")
 
+    def test_get_backend_class_follows_setting_changes(self):
+        """Cached imports still follow the configured path."""
+        settings.AGUI = {"TEST_BACKEND": "django_agui.encoders.SSEEventEncoder"}
+        assert get_backend_class("TEST_BACKEND") is SSEEventEncoder
+        settings.AGUI = {"TEST_BACKEND": "django_agui.backends.auth.DjangoAuthBackend"}
+        assert get_backend_class("TEST_BACKEND").__name__ == "DjangoAuthBackend"
+
     def test_get_backend_class_from_type(self):
         """Test backend class from direct type setting."""
         settings.AGUI = {"TEST_BACKEND": _DummyBackend}
@@ -119,3 +156,274 @@ class TestSettings:
         settings.AGUI = {"TEST_BACKEND": _DummyBackend()}
         with pytest.raises(TypeError):
             get_backend_class("TEST_BACKEND")
+
+
+class _HeaderRequest:
+    def __init__(self, headers=None, meta=None):
+        self.headers = headers or {}
+        self.META = meta or {}
+
+
+class TestRequestHeaders:
+    """Test framework-agnostic header lookup."""
+
+    def test_header_lookup_lowercase_dict(self):
+        """Plain dict headers with lowercase keys are found."""
+        request = _HeaderRequest(headers={"origin": "https://app.test"})
+        assert get_request_header(request, "Origin") == "https://app.test"
+
+    def test_header_lookup_lowercase_mapping_subclass(self):
+        """Lowercase keys are also found in dict subclasses."""
+
+        class Headers(dict):
+            pass
+
+        request = _HeaderRequest(headers=Headers(origin="https://app.test"))
+        assert get_request_header(request, "Origin") == "https://app.test"
+
+    def test_header_lookup_falls_back_to_meta(self):
+        """WSGI-style META keys are used when headers miss."""
+        request = _HeaderRequest(meta={"CONTENT_LENGTH": "12"})
+        assert get_request_header(request, "Content-Length") == "12"
+        assert get_request_header(request, "Origin") is None
+
+
+class TestCorsHeaders:
+    """Test CORS header construction."""
+
+    def test_wildcard_origin(self):
+        """Wildcard allow-lists echo ``*`` without ``Vary``."""
+        headers = get_cors_headers("https://app.test", ["*"])
+        assert headers["Access-Control-Allow-Origin"] == "*"
+        assert "Vary" not in headers
+        assert headers["Access-Control-Allow-Methods"] == "POST, OPTIONS"
+
+    def test_specific_origin(self):
+        """Listed origins are echoed back with ``Vary: Origin``."""
+        headers = get_cors_headers("https://app.test", ["https://app.test"])
+        assert headers["Access-Control-Allow-Origin"] == "https://app.test"
+        assert headers["Vary"] == "Origin"
+        assert get_cors_headers("https://app.test", ["https://app.test"]) is headers
+
+    def test_disallowed_origin(self):
+        """Unlisted origins get no CORS headers."""
+        assert dict(get_cors_headers("https://evil.test", ["https://app.test"])) == {}
+
+
+class _PerRequestBackend:
+    per_request = True
+
+
+class TestBackendInstances:
+    """Test backend instance reuse."""
+
+    def test_backend_instance_is_shared(self):
+        """Stateless backends are instantiated once."""
+        assert _instantiate_backend(_DummyBackend) is _instantiate_backend(
+            _DummyBackend
+        )
+
+    def test_default_encoder_is_shared(self):
+        """The default SSE encoder is reused across runners."""
+        settings.AGUI = {}
+        assert build_event_encoder() is build_event_encoder()
+
+    def test_per_request_backend_is_not_shared(self):
+        """Backends can opt out of sharing."""
+        assert _instantiate_backend(_PerRequestBackend) is not _instantiate_backend(
+            _PerRequestBackend
+        )
+
+
+class TestParseRunInput:
+    """Test JSON request body parsing."""
+
+    def test_parse_valid_body(self):
+        """Valid bodies are parsed into ``RunAgentInput``."""
+        input_data = parse_run_input_json(
+            b'{"threadId":"t","runId":"r","state":{},"messages":[],'
+            b'"tools":[],"context":[],"forwardedProps":{}}'
+        )
+        assert input_data.thread_id == "t"
+        assert input_data.run_id == "r"
+
+    def test_parse_malformed_json(self):
+        """Malformed JSON is reported as such."""
+        with pytest.raises(AGUIRequestError) as exc_info:
+            parse_run_input_json(b"not-json")
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.message.startswith("Invalid JSON")
+
+    def test_parse_invalid_shape(self):
+        """Well-formed JSON with the wrong shape is an invalid request."""
+        with pytest.raises(AGUIRequestError) as exc_info:
+            parse_run_input_json(b"{}")
+        assert exc_info.value.message.startswith("Invalid request")
+
+
+class TestEnforceOrigin:
+    """Test origin enforcement."""
+
+    def test_uses_passed_origin(self):
+        """A pre-read origin is used instead of re-reading headers."""
+        request = _HeaderRequest(headers={"Origin": "https://evil.test"})
+        origin, resolved = enforce_origin_and_auth(
+            request,
+            allowed_origins=["https://app.test"],
+            origin="https://app.test",
+        )
+        assert origin == "https://app.test"
+        assert resolved == ("https://app.test",)
+
+    def test_reads_origin_header_by_default(self):
+        """Disallowed origins from headers are rejected."""
+        request = _HeaderRequest(headers={"Origin": "https://evil.test"})
+        with pytest.raises(AGUIRequestError) as exc_info:
+            enforce_origin_and_auth(request, allowed_origins=["https://app.test"])
+        assert exc_info.value.status_code == 403
+
+
+class TestExecutionConfig:
+    """Test execution config resolution."""
+
+    def test_default_config_is_reused(self):
+        """Configs without overrides are cached per settings object."""
+        settings.AGUI = {"SSE_TIMEOUT": 5}
+        config = AGUIExecutionConfig.from_settings()
+        assert config.timeout == 5
+        assert AGUIExecutionConfig.from_settings() is config
+
+    def test_default_config_is_reused_without_agui_setting(self, settings):
+        """The cache also works when ``settings.AGUI`` is undefined."""
+        del settings.AGUI
+        config = AGUIExecutionConfig.from_settings()
+        assert AGUIExecutionConfig.from_settings() is config
+
+    def test_reassigned_settings_invalidate_cache(self):
+        """Replacing ``settings.AGUI`` is picked up without a signal."""
+        settings.AGUI = {"SSE_TIMEOUT": 5}
+        AGUIExecutionConfig.from_settings()
+        settings.AGUI = {"SSE_TIMEOUT": 7}
+        assert AGUIExecutionConfig.from_settings().timeout == 7
+
+    def test_overrides_bypass_cache(self):
+        """Per-view overrides are applied on top of settings."""
+        settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": True}
+        config = AGUIExecutionConfig.from_settings(emit_run_lifecycle_events=False)
+        assert config.emit_run_lifecycle_events is False
+
+
+class _CountingAuthBackend:
+    calls = 0
+
+    def authenticate(self, request):
+        type(self).calls += 1
+        return "user" if get_request_header(request, "Authorization") else None
+
+    def check_permission(self, user, agent_path):
+        return True
+
+
+class TestAuthCache:
+    """Test the optional authentication result cache."""
+
+    def setup_method(self):
+        """Reset the backend call counter and the auth cache."""
+        _CountingAuthBackend.calls = 0
+        invalidate_auth_cache()
+
+    def _request(self, token="Bearer a"):
+        request = _HeaderRequest(headers={"Authorization": token} if token else {})
+        request.path = "/agent/"
+        return request
+
+    def test_cache_disabled_by_default(self):
+        """Without a TTL the backend runs on every request."""
+        settings.AGUI = {"AUTH_BACKEND": _CountingAuthBackend}
+        authenticate_request(self._request())
+        authenticate_request(self._request())
+        assert _CountingAuthBackend.calls == 2
+
+    def test_cache_reuses_result_per_credential(self):
+        """Repeated credentials hit the cache; new ones do not."""
+        settings.AGUI = {"AUTH_BACKEND": _CountingAuthBackend, "AUTH_CACHE_TTL": 30}
+        first = authenticate_request(self._request())
+        request = self._request()
+        assert authenticate_request(request) is first
+        assert request.agui_user == "user"
+        authenticate_request(self._request("Bearer b"))
+        assert _CountingAuthBackend.calls == 2
+
+    def test_shared_anonymous_result_is_immutable(self):
+        """The shared anonymous result cannot be modified by a caller."""
+        settings.AGUI = {"AUTH_BACKEND": _CountingAuthBackend}
+        result = authenticate_request(self._request(token=None))
+        assert result.allowed
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.user = "intruder"
+
+    def test_cache_keys_on_session_as_well_as_authorization(self):
+        """A shared ``Authorization`` header does not share session results."""
+        settings.AGUI = {"AUTH_BACKEND": _CountingAuthBackend, "AUTH_CACHE_TTL": 30}
+        first = self._request("Basic gateway")
+        first.COOKIES = {"sessionid": "alice"}
+        second = self._request("Basic gateway")
+        second.COOKIES = {"sessionid": "bob"}
+        authenticate_request(first)
+        authenticate_request(second)
+        assert _CountingAuthBackend.calls == 2
+
+    def test_anonymous_results_are_not_cached(self):
+        """Requests without credentials always reach the backend."""
+        settings.AGUI = {"AUTH_BACKEND": _CountingAuthBackend, "AUTH_CACHE_TTL": 30}
+        authenticate_request(self._request(token=None))
+        result = authenticate_request(self._request(token=None), auth_required=True)
+        assert result.status_code == 401
+        assert _CountingAuthBackend.calls == 2
+
+    def test_invalidate_auth_cache(self):
+        """Invalidation forces the backend to run again."""
+        settings.AGUI = {"AUTH_BACKEND": _CountingAuthBackend, "AUTH_CACHE_TTL": 30}
+        authenticate_request(self._request())
+        invalidate_auth_cache()
+        authenticate_request(self._request())
+        assert _CountingAuthBackend.calls == 2
+
+
+class _LoopCheckingAuthBackend:
+    def authenticate(self, request):
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        return "user"
+
+    def check_permission(self, user, agent_path):
+        return True
+
+
+class TestAsyncAuth:
+    """Test authentication from async views."""
+
+    async def test_backend_runs_off_event_loop(self):
+        """Auth backends are called outside the running event loop."""
+        settings.AGUI = {"AUTH_BACKEND": _LoopCheckingAuthBackend}
+        request = _HeaderRequest(headers={})
+        result = await aauthenticate_request(request, auth_required=True)
+        assert result.allowed
+        assert request.agui_user == "user"
+
+    async def test_enforce_rejects_disallowed_origin(self):
+        """The async variant applies the same origin check."""
+        request = _HeaderRequest(headers={"Origin": "https://evil.test"})
+        with pytest.raises(AGUIRequestError) as exc_info:
+            await aenforce_origin_and_auth(
+                request, auth_required=False, allowed_origins=["https://app.test"]
+            )
+        assert exc_info.value.status_code == 403
+
+
+async def test_setup_uvloop_warns_inside_running_loop():
+    """Installing a loop policy from a running loop is refused with a warning."""
+    policy = asyncio.get_event_loop_policy()
+    with pytest.warns(RuntimeWarning, match="no effect"):
+        setup_uvloop()
+    assert asyncio.get_event_loop_policy() is policy
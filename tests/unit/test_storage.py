@@ -0,0 +1,340 @@
+"""Unit tests for the Django ORM storage backend."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from django.core.cache import cache
+from django.db import connections
+import pytest
+
+from django_agui import models as django_models
+from django_agui.storage import django as django_storage
+from django_agui.storage.base import (
+    Event,
+    Message,
+    MessageStorage,
+    Run,
+    Thread,
+    ToolCall,
+)
+from django_agui.storage.django import DjangoFileStorage, DjangoStorageBackend
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+async def _save_messages(backend, thread_id, indexes):
+    if await backend.threads.get_thread(thread_id) is None:
+        await backend.threads.save_thread(Thread(id=thread_id, user_id=None))
+    for index in indexes:
+        await backend.messages.save_message(
+            Message(
+                id=f"{thread_id}-msg-{index}",
+                thread_id=thread_id,
+                run_id=None,
+                role="user",
+                content=str(index),
+                mime_type="text/plain",
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_file_storage_delete_clears_renamed_copies(settings, tmp_path):
+    """Deleting a file also removes copies renamed on a name collision."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    storage = DjangoFileStorage()
+
+    await storage.save_file("file-1", b"first", "text/plain", "notes.txt")
+    await storage.save_file("file-1", b"second", "text/plain", "notes.txt")
+    assert len(list((tmp_path / "agui" / "file-1").iterdir())) == 2
+
+    assert await storage.get_file("file-1", "notes.txt") == b"first"
+    assert await storage.delete_file("file-1", "notes.txt") is True
+    assert list((tmp_path / "agui" / "file-1").iterdir()) == []
+    assert await storage.get_file("file-1", "notes.txt") is None
+    assert await storage.delete_file("file-1", "notes.txt") is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_message_count_cache_is_dropped_on_save(monkeypatch):
+    """A cached count is invalidated when the thread gets a new message."""
+    monkeypatch.setattr(django_storage, "_MESSAGE_COUNT_CACHE_THRESHOLD", 1)
+    backend = DjangoStorageBackend()
+    await _save_messages(backend, "thread-1", range(2))
+
+    assert await backend.messages.count_messages("thread-1") == 2
+    assert await cache.aget(django_storage._message_count_key("thread-1")) == 2
+
+    await _save_messages(backend, "thread-1", [2])
+    assert await cache.aget(django_storage._message_count_key("thread-1")) is None
+    assert await backend.messages.count_messages("thread-1") == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_message_count_cache_is_shared_between_backends(monkeypatch):
+    """A save through one backend drops the count another backend cached."""
+    monkeypatch.setattr(django_storage, "_MESSAGE_COUNT_CACHE_THRESHOLD", 1)
+    counting, saving = DjangoStorageBackend(), DjangoStorageBackend()
+    await _save_messages(saving, "thread-1", range(2))
+
+    assert await counting.messages.count_messages("thread-1") == 2
+    await _save_messages(saving, "thread-1", [2])
+    assert await counting.messages.count_messages("thread-1") == 3
+
+
+_T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _run(run_id, thread_id="thread-1", status="running", started_at=_T0):
+    return Run(
+        id=run_id,
+        thread_id=thread_id,
+        parent_run_id=None,
+        status=status,
+        input_data={},
+        output_state=None,
+        started_at=started_at,
+    )
+
+
+def _message(message_id, created_at, thread_id="thread-1"):
+    return Message(
+        id=message_id,
+        thread_id=thread_id,
+        run_id=None,
+        role="user",
+        content=message_id,
+        mime_type="text/plain",
+        created_at=created_at,
+    )
+
+
+@pytest.fixture
+def backend():
+    """Storage backend with event storage buffering two events per write."""
+    return DjangoStorageBackend(enable_event_storage=True, event_batch_size=2)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDjangoStorage:
+    """DB-backed tests for the Django ORM storage backend."""
+
+    @pytest.mark.parametrize("supports_update_conflicts", [True, False])
+    async def test_save_thread_upserts(
+        self, backend, monkeypatch, supports_update_conflicts
+    ):
+        """Saving twice updates the row, with or without ON CONFLICT support."""
+        features = connections["default"].features
+        monkeypatch.setattr(
+            features, "supports_update_conflicts", supports_update_conflicts
+        )
+        await backend.threads.save_thread(
+            Thread(id="thread-1", user_id=None, metadata={"v": 1})
+        )
+        await backend.threads.save_thread(
+            Thread(id="thread-1", user_id=None, metadata={"v": 2})
+        )
+
+        thread = await backend.threads.get_thread("thread-1")
+        assert thread.metadata == {"v": 2}
+        assert await django_models.Thread.objects.acount() == 1
+
+    async def test_list_runs_keyset_pagination(self, backend):
+        """``after`` continues a newest-first listing across timestamp ties."""
+        await backend.threads.save_thread(Thread(id="thread-1", user_id=None))
+        for run_id, started_at in (
+            ("run-a", _T0),
+            ("run-b", _T0 + timedelta(seconds=1)),
+            ("run-c", _T0 + timedelta(seconds=1)),
+        ):
+            await backend.runs.save_run(_run(run_id, started_at=started_at))
+
+        first = await backend.runs.list_runs("thread-1", limit=2)
+        assert [run.id for run in first] == ["run-c", "run-b"]
+        last = first[-1]
+        rest = await backend.runs.list_runs(
+            "thread-1", after=(last.started_at, last.id)
+        )
+        assert [run.id for run in rest] == ["run-a"]
+
+    async def test_message_listing_and_lookup(self, backend):
+        """Messages page by keyset, stream in order and batch-load by ID."""
+        await backend.threads.save_thread(Thread(id="thread-1", user_id=None))
+        for message_id, created_at in (
+            ("msg-a", _T0),
+            ("msg-b", _T0),
+            ("msg-c", _T0 + timedelta(seconds=1)),
+        ):
+            await backend.messages.save_message(_message(message_id, created_at))
+
+        first = await backend.messages.list_messages("thread-1", limit=2)
+        assert [message.id for message in first] == ["msg-a", "msg-b"]
+        rest = await backend.messages.list_messages(
+            "thread-1", after=(first[-1].created_at, first[-1].id)
+        )
+        assert [message.id for message in rest] == ["msg-c"]
+
+        streamed = [
+            message.id async for message in backend.messages.iter_messages("thread-1")
+        ]
+        assert streamed == ["msg-a", "msg-b", "msg-c"]
+
+        found = await backend.messages.get_messages(["msg-c", "msg-a", "missing"])
+        assert set(found) == {"msg-a", "msg-c"}
+        assert found["msg-c"].file_url is None
+        assert await backend.messages.get_messages([]) == {}
+
+    async def test_thread_messages_before_pivot(self, backend):
+        """``before_id`` filters on the pivot's timestamp in the same query."""
+        await backend.threads.save_thread(Thread(id="thread-1", user_id=None))
+        for index in range(3):
+            await backend.messages.save_message(
+                _message(f"msg-{index}", _T0 + timedelta(seconds=index))
+            )
+
+        before = [
+            message.id
+            async for message in backend.messages.get_thread_messages(
+                "thread-1", before_id="msg-2"
+            )
+        ]
+        assert before == ["msg-0", "msg-1"]
+        unknown = [
+            message.id
+            async for message in backend.messages.get_thread_messages(
+                "thread-1", before_id="missing"
+            )
+        ]
+        assert unknown == ["msg-0", "msg-1", "msg-2"]
+
+    async def test_list_tool_calls_keyset_pagination(self, backend):
+        """Tool calls page by ``(started_at, id)``."""
+        await backend.threads.save_thread(Thread(id="thread-1", user_id=None))
+        await backend.runs.save_run(_run("run-1"))
+        for tool_call_id in ("call-a", "call-b", "call-c"):
+            await backend.tool_calls.save_tool_call(
+                ToolCall(
+                    id=tool_call_id,
+                    run_id="run-1",
+                    message_id=None,
+                    tool_name="search",
+                    arguments={},
+                    result=None,
+                    status="completed",
+                    started_at=_T0,
+                )
+            )
+
+        first = await backend.tool_calls.list_tool_calls("run-1", limit=1)
+        rest = await backend.tool_calls.list_tool_calls(
+            "run-1", after=(first[0].started_at, first[0].id)
+        )
+        assert [call.id for call in first + rest] == ["call-a", "call-b", "call-c"]
+
+    async def test_event_batching_and_reads(self, backend):
+        """Buffered events are written per batch and flushed before reads."""
+        await backend.threads.save_thread(Thread(id="thread-1", user_id=None))
+        await backend.runs.save_run(_run("run-1"))
+        events = [
+            Event(
+                id=f"event-{index}",
+                run_id="run-1",
+                event_type="TEXT_MESSAGE_CONTENT",
+                data={"index": index},
+                created_at=_T0 + timedelta(seconds=index),
+            )
+            for index in range(3)
+        ]
+
+        await backend.events.save_event(events[0])
+        assert await django_models.Event.objects.acount() == 0
+        await backend.events.save_event(events[1])
+        assert await django_models.Event.objects.acount() == 2
+        await backend.events.save_event(events[2])
+        assert await django_models.Event.objects.acount() == 2
+
+        listed = await backend.events.list_events("run-1")
+        assert [event.id for event in listed] == ["event-0", "event-1", "event-2"]
+        after = [
+            event.id
+            async for event in backend.events.get_events_for_run(
+                "run-1", after_id="event-0"
+            )
+        ]
+        assert after == ["event-1", "event-2"]
+
+    async def test_close_flushes_buffered_events(self, backend):
+        """``close()`` writes events still waiting for a full batch."""
+        await backend.threads.save_thread(Thread(id="thread-1", user_id=None))
+        await backend.runs.save_run(_run("run-1"))
+        await backend.events.save_event(
+            Event(id="event-0", run_id="run-1", event_type="RUN_STARTED", data={})
+        )
+        assert await django_models.Event.objects.acount() == 0
+
+        await backend.close()
+        assert await django_models.Event.objects.acount() == 1
+
+    async def test_update_run_status_skips_repeated_status(self, backend):
+        """Repeating a non-terminal status skips the UPDATE; others write."""
+        await backend.threads.save_thread(Thread(id="thread-1", user_id=None))
+        await backend.runs.save_run(_run("run-1", status="pending"))
+        runs = django_models.Run.objects.filter(id="run-1")
+
+        await backend.runs.update_run_status("run-1", "running")
+        await runs.aupdate(status="changed-elsewhere")
+        await backend.runs.update_run_status("run-1", "running")
+        assert (await backend.runs.get_run("run-1")).status == "changed-elsewhere"
+
+        await backend.runs.update_run_status("run-1", "completed")
+        run = await backend.runs.get_run("run-1")
+        assert run.status == "completed"
+        assert run.finished_at is not None
+
+        await backend.runs.save_run(_run("run-1", status="running"))
+        await runs.aupdate(status="changed-elsewhere")
+        await backend.runs.update_run_status("run-1", "running")
+        assert (await backend.runs.get_run("run-1")).status == "running"
+
+
+class _ListMessageStorage(MessageStorage):
+    """Minimal storage implementing only the abstract methods."""
+
+    def __init__(self, messages):
+        self._messages = messages
+
+    async def save_message(self, message):
+        self._messages.append(message)
+
+    async def get_message(self, message_id):
+        return next((m for m in self._messages if m.id == message_id), None)
+
+    async def list_messages(self, thread_id, limit=1000, offset=0, after=None):
+        matching = [m for m in self._messages if m.thread_id == thread_id]
+        return matching[offset : offset + limit]
+
+    async def get_thread_messages(self, thread_id, before_id=None, limit=1000):
+        for message in await self.list_messages(thread_id, limit):
+            yield message
+
+
+async def test_message_storage_default_helpers():
+    """``MessageStorage`` provides working defaults for the batch helpers."""
+    storage = _ListMessageStorage(
+        [_message(f"msg-{index}", _T0) for index in range(1001)]
+    )
+
+    assert await storage.count_messages("thread-1") == 1001
+    assert await storage.count_messages("other") == 0
+    found = await storage.get_messages(["msg-1", "missing"])
+    assert list(found) == ["msg-1"]
+    streamed = [m.id async for m in storage.iter_messages("thread-1", limit=2)]
+    assert streamed == ["msg-0", "msg-1"]
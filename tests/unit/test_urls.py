@@ -173,3 +173,22 @@ class TestGetAguiUrlPatterns:
 
         names = [pattern.name for pattern in router.urls]
         assert names == ["agui-alpha", "agui-beta"]
+
+    async def test_router_urls_are_reused_until_register(self):
+        """URL patterns are built once and rebuilt after a new registration."""
+
+        async def dummy_agent(input_data, request):
+            yield TextMessageContentEvent(
+                type=EventType.TEXT_MESSAGE_CONTENT,
+                message_id="msg-1",
+                delta="Hello",
+            )
+
+        router = AGUIRouter()
+        router.register("alpha", dummy_agent)
+        first = router.urls
+        assert router.urls[0] is first[0]
+
+        router.register("beta", dummy_agent)
+        names = [pattern.name for pattern in router.urls]
+        assert names == ["agui-alpha", "agui-beta"]
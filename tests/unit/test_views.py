@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 
 from ag_ui.core import (
     EventType,
@@ -14,6 +15,8 @@ from ag_ui.core import (
 from django.test.client import AsyncRequestFactory
 import pytest
 
+from django_agui.encoders import SSEEventEncoder
+from django_agui.runtime import AGUIRunner
 from django_agui.views import AGUIView
 
 
@@ -25,6 +28,16 @@ class _AuthBackendNone:
         return False
 
 
+class _StrEventEncoder(SSEEventEncoder):
+    def encode(self, event):
+        return super().encode(event).decode("utf-8")
+
+
+class _BytesEventEncoderWithoutKeepalive:
+    def encode(self, event):
+        return b"data: " + event.model_dump_json(by_alias=True).encode() + b"\n\n"
+
+
 class _StateBackendRecorder:
     saved: list[tuple[str, str, object]] = []
     deleted: list[str] = []
@@ -255,6 +268,39 @@ async def test_view_timeout_emits_run_error(settings):
     payload = "".join(await _collect_streaming_chunks(response))
     assert '"type":"RUN_ERROR"' in payload
     assert '"code":"timeout"' in payload
+    assert "AG-UI stream timed out" in payload
+
+
+@pytest.mark.asyncio
+async def test_view_timeout_with_keepalive_emits_run_error(settings):
+    """The run deadline also applies while keepalives are being sent."""
+    settings.AGUI = {
+        "SSE_TIMEOUT": 1,
+        "SSE_KEEPALIVE_INTERVAL": 1,
+        "ERROR_DETAIL_POLICY": "full",
+    }
+
+    async def slow_agent(input_data, request):
+        await asyncio.sleep(2)
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="too-late",
+        )
+
+    view = AGUIView.as_view(run_agent=slow_agent)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    payload = "".join(await _collect_streaming_chunks(response))
+    assert '"code":"timeout"' in payload
+    assert "too-late" not in payload
 
 
 @pytest.mark.asyncio
@@ -289,6 +335,34 @@ async def test_view_keepalive_does_not_cancel_slow_agent(settings):
     assert "event-after-keepalive" in payload
 
 
+@pytest.mark.asyncio
+async def test_view_default_keepalive_stream_finishes(settings):
+    """The default keepalive path (eager tasks on 3.12+) completes the run."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": True}
+
+    async def agent(input_data, request):
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="hello",
+        )
+
+    view = AGUIView.as_view(run_agent=agent)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    payload = "".join(await _collect_streaming_chunks(response))
+    assert '"delta":"hello"' in payload
+    assert '"type":"RUN_FINISHED"' in payload
+    assert "RUN_ERROR" not in payload
+
+
 @pytest.mark.asyncio
 async def test_view_auto_error_policy_uses_debug_setting(settings):
     """Auto policy exposes details in DEBUG mode."""
@@ -431,6 +505,25 @@ async def test_view_options_does_not_require_auth(settings):
 
     response = await view(request)
     assert response.status_code == 204
+    assert response["Access-Control-Max-Age"] == "600"
+    assert response["Cache-Control"] == "public, max-age=600"
+
+
+@pytest.mark.asyncio
+async def test_view_options_disallowed_origin_is_not_cacheable(settings):
+    """Preflights without CORS headers carry no caching headers."""
+    settings.AGUI = {"ALLOWED_ORIGINS": ["https://app.test"]}
+
+    view = AGUIView.as_view(run_agent=lambda *args: None)
+    request = AsyncRequestFactory().options(
+        "/agent/",
+        HTTP_ORIGIN="https://evil.test",
+    )
+
+    response = await view(request)
+    assert response.status_code == 204
+    assert "Access-Control-Max-Age" not in response
+    assert "Cache-Control" not in response
 
 
 @pytest.mark.asyncio
@@ -505,3 +598,371 @@ async def test_invalid_allowed_origins_returns_500(settings):
 
     response = await view(request)
     assert response.status_code == 500
+
+
+class _StateBackendLoader:
+    async def save_state(self, thread_id, run_id, state):
+        return None
+
+    async def load_state(self, thread_id):
+        return {"loaded": thread_id}
+
+    async def delete_state(self, thread_id):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_view_prepares_system_message_and_loaded_state(settings):
+    """System message and persisted state are applied to the same input."""
+    settings.AGUI = {"STATE_BACKEND": f"{__name__}._StateBackendLoader"}
+    seen: list[RunAgentInput] = []
+
+    async def agent(input_data, request):
+        seen.append(input_data)
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="ok",
+        )
+
+    view = AGUIView.as_view(
+        run_agent=agent,
+        get_system_message=lambda request: "be brief",
+    )
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    await _collect_streaming_chunks(response)
+
+    assert seen[0].state == {"loaded": "thread-1"}
+    assert seen[0].messages[0].role == "system"
+    assert seen[0].messages[0].content == "be brief"
+
+
+async def _async_gen_translator(event):
+    yield event
+    yield TextMessageContentEvent(
+        type=EventType.TEXT_MESSAGE_CONTENT,
+        message_id="msg-1",
+        delta="translated",
+    )
+
+
+def _list_translator(event):
+    return [
+        event,
+        TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="translated",
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("translator", [_async_gen_translator, _list_translator])
+async def test_view_translate_event_expands_events(settings, translator):
+    """Async generator and iterable translators can fan out events."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": False}
+
+    async def agent(input_data, request):
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="original",
+        )
+
+    view = AGUIView.as_view(run_agent=agent, translate_event=translator)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    payload = "".join(await _collect_streaming_chunks(response))
+    assert payload.index('"delta":"original"') < payload.index('"delta":"translated"')
+
+
+@pytest.mark.asyncio
+async def test_view_translator_list_is_sent_as_one_chunk(settings):
+    """Events returned together by a translator share one streamed chunk."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": False}
+
+    async def agent(input_data, request):
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="original",
+        )
+
+    view = AGUIView.as_view(run_agent=agent, translate_event=_list_translator)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    chunks = await _collect_streaming_chunks(response)
+    assert len(chunks) == 1
+    assert chunks[0].count("data: ") == 2
+
+
+@pytest.mark.asyncio
+async def test_view_batch_bytes_caps_coalesced_chunks(settings):
+    """Coalescing stops once a chunk reaches ``SSE_BATCH_BYTES``."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": False, "SSE_BATCH_BYTES": 1}
+
+    async def agent(input_data, request):
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="original",
+        )
+
+    view = AGUIView.as_view(run_agent=agent, translate_event=_list_translator)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    chunks = await _collect_streaming_chunks(response)
+    assert len(chunks) == 2
+
+
+@pytest.mark.asyncio
+async def test_view_streams_sync_generator_agent(settings):
+    """Plain generator agents are adapted to async iteration."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": False}
+
+    def agent(input_data, request):
+        for delta in ("one", "two"):
+            yield TextMessageContentEvent(
+                type=EventType.TEXT_MESSAGE_CONTENT,
+                message_id="msg-1",
+                delta=delta,
+            )
+
+    view = AGUIView.as_view(run_agent=agent)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    # Django buffers sync streaming_content under ASGI; the runner must
+    # always hand the response an async iterator.
+    assert response.is_async
+    payload = "".join(await _collect_streaming_chunks(response))
+    assert payload.index('"delta":"one"') < payload.index('"delta":"two"')
+
+
+@pytest.mark.asyncio
+async def test_view_streams_without_keepalive_or_timeout(settings):
+    """Disabling keepalive and timeout streams events straight through."""
+    settings.AGUI = {"SSE_TIMEOUT": 0, "SSE_KEEPALIVE_INTERVAL": 0}
+
+    async def agent(input_data, request):
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="direct",
+        )
+
+    view = AGUIView.as_view(run_agent=agent)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    payload = "".join(await _collect_streaming_chunks(response))
+    assert '"delta":"direct"' in payload
+    assert '"type":"RUN_FINISHED"' in payload
+    assert ": keepalive" not in payload
+
+
+@pytest.mark.asyncio
+async def test_view_sends_run_started_before_slow_first_event(settings):
+    """RUN_STARTED is not held back while the agent is still working."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": True}
+    gate = asyncio.Event()
+
+    async def agent(input_data, request):
+        await gate.wait()
+        yield TextMessageStartEvent(
+            type=EventType.TEXT_MESSAGE_START,
+            message_id="msg-1",
+        )
+
+    view = AGUIView.as_view(run_agent=agent)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    stream = aiter(response.streaming_content)
+    first = await asyncio.wait_for(anext(stream), timeout=1)
+    assert b'"type":"RUN_STARTED"' in first
+    assert b'"type":"TEXT_MESSAGE_START"' not in first
+    gate.set()
+    rest = b"".join([chunk async for chunk in stream])
+    assert b'"type":"TEXT_MESSAGE_START"' in rest
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_after_run_started_stops_agent(settings):
+    """Closing the stream after RUN_STARTED does not leave the agent running."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": True}
+    steps: list[str] = []
+
+    async def agent(input_data, request):
+        steps.append("started")
+        await asyncio.sleep(0.05)
+        steps.append("finished first step")
+        yield TextMessageStartEvent(
+            type=EventType.TEXT_MESSAGE_START,
+            message_id="msg-1",
+        )
+
+    runner = AGUIRunner(run_agent=agent, request=AsyncRequestFactory().post("/"))
+    stream = runner.stream(_run_input())
+    assert b'"type":"RUN_STARTED"' in await anext(stream)
+    await stream.aclose()
+    await asyncio.sleep(0.1)
+    assert "finished first step" not in steps
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="needs eager tasks")
+async def test_view_coalesces_run_started_with_ready_first_event(settings):
+    """A first event that is ready immediately shares RUN_STARTED's chunk."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": True}
+
+    async def agent(input_data, request):
+        yield TextMessageStartEvent(
+            type=EventType.TEXT_MESSAGE_START,
+            message_id="msg-1",
+        )
+
+    view = AGUIView.as_view(run_agent=agent)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    chunks = await _collect_streaming_chunks(response)
+    assert '"type":"RUN_STARTED"' in chunks[0]
+    assert '"type":"TEXT_MESSAGE_START"' in chunks[0]
+
+
+@pytest.mark.asyncio
+async def test_view_error_before_first_event_keeps_run_started(settings):
+    """RUN_STARTED still precedes RUN_ERROR when the agent fails early."""
+    settings.AGUI = {"EMIT_RUN_LIFECYCLE_EVENTS": True}
+
+    async def agent(input_data, request):
+        raise RuntimeError("early")
+        yield  # pragma: no cover
+
+    view = AGUIView.as_view(run_agent=agent)
+    factory = AsyncRequestFactory()
+    request = factory.generic(
+        "POST",
+        "/agent/",
+        data=_run_input().model_dump_json(by_alias=True),
+        content_type="application/json",
+    )
+
+    response = await view(request)
+    payload = "".join(await _collect_streaming_chunks(response))
+    assert payload.index('"type":"RUN_STARTED"') < payload.index('"type":"RUN_ERROR"')
+
+
+def test_view_freezes_allowed_origins_list():
+    """Per-route and class-level origin lists are stored as tuples."""
+
+    class Subclass(AGUIView):
+        allowed_origins = ["https://a.example"]
+
+    view = AGUIView.as_view(
+        run_agent=lambda *args: None, allowed_origins=["https://b.example"]
+    )
+
+    assert Subclass.allowed_origins == ("https://a.example",)
+    assert view.view_initkwargs["allowed_origins"] == ("https://b.example",)
+
+
+def test_view_is_csrf_exempt():
+    """The view callable is exempt from CsrfViewMiddleware."""
+    from django.middleware.csrf import CsrfViewMiddleware
+
+    view = AGUIView.as_view(run_agent=lambda *args: None)
+    request = AsyncRequestFactory().post("/agent/", data={})
+
+    middleware = CsrfViewMiddleware(lambda request: None)
+    assert view.csrf_exempt is True
+    assert middleware.process_view(request, view, (), {}) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "encoder", ["_StrEventEncoder", "_BytesEventEncoderWithoutKeepalive"]
+)
+async def test_runner_normalizes_custom_encoder_packets(settings, encoder):
+    """Custom encoder packets and keepalives are all streamed as bytes."""
+    settings.AGUI = {
+        "EVENT_ENCODER": f"{__name__}.{encoder}",
+        "SSE_KEEPALIVE_INTERVAL": 1,
+        "SSE_TIMEOUT": 0,
+    }
+
+    async def slow_agent(input_data, request):
+        await asyncio.sleep(1.1)
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="msg-1",
+            delta="after-keepalive",
+        )
+
+    runner = AGUIRunner(
+        run_agent=slow_agent,
+        request=AsyncRequestFactory().post("/agent/"),
+        translate_event=_list_translator,
+    )
+    packets = [packet async for packet in runner.stream(_run_input())]
+    assert all(isinstance(packet, bytes) for packet in packets)
+    payload = b"".join(packets)
+    assert b": keepalive" in payload
+    assert b"after-keepalive" in payload
+    assert b'"type":"RUN_FINISHED"' in payload
+    assert b"RUN_ERROR" not in payload